@@ -17,16 +17,17 @@ Date: February 2026
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 import os
 from pathlib import Path
 
 # Import custom modules
-from src.data_loader_ecommerce import IndianEcommerceCatalogLoader
+from src.data_loader_ecommerce import IndianEcommerceCatalogLoader, convert_to_categorical
 from src.category_engine import CategoryMappingEngine
 from src.catalog_module import ProductCatalog
-from src.pricing_module import PricingAnalyzer
+from src.pricing_module import PricingAnalyzer, calculate_discount_pct
 from src.analytics_module import ProcurementAnalytics
 
 
@@ -67,18 +68,23 @@ st.markdown("""
 # CACHE & INITIALIZATION
 # ============================================================================
 
-@st.cache_resource
-def load_data():
-    """Load and cache product data"""
-    csv_path = os.path.join(os.path.dirname(__file__), 'data', 'sample_data.csv')
-    
-    if not os.path.exists(csv_path):
-        st.error(f"❌ Data file not found: {csv_path}")
-        st.stop()
-    
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'data', 'sample_data.csv')
+
+
+@st.cache_data(ttl=3600)
+def load_data(csv_path, data_version):
+    """Load and cache product data (data_version is the CSV mtime, so edits invalidate the cache)"""
     try:
         loader = IndianEcommerceCatalogLoader(csv_path)
-        return loader.get_dataframe()
+        df = loader.get_dataframe()
+        
+        # Low-cardinality text columns as categoricals for cheaper groupby/filter
+        convert_to_categorical(df)
+        
+        # Discount % computed once here so pages (and PricingAnalyzer) read the column directly
+        df["discount_pct"] = calculate_discount_pct(df)
+        
+        return df
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         st.stop()
@@ -89,18 +95,156 @@ def initialize_modules(df):
     """Initialize analytics modules"""
     category_engine = CategoryMappingEngine()
     catalog = ProductCatalog(df)
-    pricing = PricingAnalyzer()
+    pricing = PricingAnalyzer(df)
     analytics = ProcurementAnalytics(df)
     
     return category_engine, catalog, pricing, analytics
 
 
+@st.cache_data
+def compute_dashboard_aggregates(df):
+    """Compute and cache the dashboard distribution aggregates"""
+    return {
+        # Sorted groupby + stable sort: ties stay in name order, so the top-10 cut is deterministic
+        "category_dist": df.groupby("category", observed=True).size().sort_values(ascending=False, kind="stable"),
+        "brand_dist": df.groupby("brand", observed=True).size().sort_values(ascending=False, kind="stable").head(10),
+        "supplier_avg": df.groupby("supplier_name", observed=True, sort=False)["selling_price"].mean().sort_values(),
+        "price_hist": np.histogram(df["selling_price"].to_numpy(), bins=30)
+    }
+
+
+@st.cache_data
+def get_lookup_lists(_catalog, data_version):
+    """Compute and cache the product dropdown option list"""
+    return {
+        "products": tuple(_catalog.df["product_name"].unique())
+    }
+
+
+@st.cache_data
+def search_product_ids(_catalog, query, data_version):
+    """Search the catalog and cache matching product IDs per query"""
+    return _catalog.search_products(query, return_ids=True)
+
+
+@st.cache_data(max_entries=256)
+def get_product_pricing(_pricing, _df, product_id, data_version):
+    """Compute and cache the pricing analysis and savings opportunity per product"""
+    return {
+        "analysis": _pricing.analyze_product_pricing(_df, product_id),
+        "savings": _pricing.calculate_savings_opportunity(_df, product_id)
+    }
+
+
+@st.cache_data
+def get_market_intelligence(_analytics, data_version):
+    """Compute and cache the Market Intelligence page reports"""
+    return {
+        "category_perf": _analytics.get_category_performance(),
+        "supplier_perf": _analytics.get_supplier_performance(),
+        "competitiveness": _analytics.get_price_competitiveness(),
+        "savings": _analytics.get_savings_potential(),
+        "strategic": _analytics.identify_strategic_products()
+    }
+
+
+@st.cache_data
+def to_csv_bytes(df, index=True):
+    """Serialize a dataframe to CSV and cache the bytes for download buttons"""
+    return df.to_csv(index=index).encode("utf-8")
+
+
+# ============================================================================
+# CHART BUILDERS
+# ============================================================================
+
+@st.cache_data
+def build_bar_chart(labels, values, title, axis_labels=None, orientation='v', height=None):
+    """Build and cache a bar chart from pre-aggregated labels and values"""
+    if orientation == 'h':
+        fig = px.bar(x=values, y=labels, orientation='h', labels=axis_labels, title=title)
+    else:
+        fig = px.bar(x=labels, y=values, labels=axis_labels, title=title)
+    
+    fig.update_layout(showlegend=False)
+    if height:
+        fig.update_layout(height=height)
+    return fig
+
+
+@st.cache_data
+def build_pie_chart(names, values, title, height=None):
+    """Build and cache a pie chart from pre-aggregated names and values"""
+    fig = px.pie(values=values, names=names, title=title)
+    if height:
+        fig.update_layout(height=height)
+    return fig
+
+
+@st.cache_data
+def build_histogram_chart(counts, edges, title, x_label, height=None):
+    """Build and cache a histogram from pre-binned counts and bin edges"""
+    edges = np.asarray(edges)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        hovertemplate=f'{x_label}: %{{x:.2f}}<br>Frequency: %{{y}}<extra></extra>'
+    ))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title="Frequency", bargap=0)
+    if height:
+        fig.update_layout(height=height)
+    return fig
+
+
+@st.cache_data
+def build_box_chart(q1, median, q3, lowerfence, upperfence, outliers, title, y_label, height=None):
+    """Build and cache a box plot from precomputed quartiles, fences and outliers"""
+    fig = go.Figure(go.Box(
+        q1=[q1],
+        median=[median],
+        q3=[q3],
+        lowerfence=[lowerfence],
+        upperfence=[upperfence],
+        y=[list(outliers)],
+        boxpoints='outliers',
+        name=y_label
+    ))
+    fig.update_layout(title=title, yaxis_title=y_label, showlegend=False)
+    if height:
+        fig.update_layout(height=height)
+    return fig
+
+
+def compute_box_stats(values):
+    """Compute Tukey box-plot statistics (quartiles, whisker fences, outliers)"""
+    values = np.asarray(values, dtype=float)
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    inliers = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    outliers = values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)]
+    return {
+        "q1": float(q1),
+        "median": float(median),
+        "q3": float(q3),
+        "lowerfence": float(inliers.min()),
+        "upperfence": float(inliers.max()),
+        "outliers": tuple(outliers.tolist())
+    }
+
+
 # ============================================================================
 # LOAD DATA & MODULES
 # ============================================================================
 
-df = load_data()
+if not os.path.exists(DATA_PATH):
+    st.error(f"❌ Data file not found: {DATA_PATH}")
+    st.stop()
+
+data_version = os.path.getmtime(DATA_PATH)
+df = load_data(DATA_PATH, data_version)
 category_engine, catalog, pricing_analyzer, analytics = initialize_modules(df)
+lookups = get_lookup_lists(catalog, data_version)
 
 # ============================================================================
 # HEADER
@@ -169,31 +313,33 @@ if page == "🏠 Dashboard":
     
     st.markdown("---")
     
+    dashboard_aggs = compute_dashboard_aggregates(df)
+    
     # Category Distribution
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("#### Category Distribution")
-        category_dist = df.groupby("category").size().sort_values(ascending=False)
-        fig = px.bar(
-            x=category_dist.values,
-            y=category_dist.index,
+        category_dist = dashboard_aggs["category_dist"]
+        fig = build_bar_chart(
+            tuple(category_dist.index),
+            tuple(category_dist.values),
+            "Products by Category",
+            axis_labels={'x': 'Number of Products', 'y': 'Category'},
             orientation='h',
-            labels={'x': 'Number of Products', 'y': 'Category'},
-            title="Products by Category"
+            height=400
         )
-        fig.update_layout(height=400, showlegend=False)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("#### Brand Distribution (Top 10)")
-        brand_dist = df.groupby("brand").size().sort_values(ascending=False).head(10)
-        fig = px.pie(
-            values=brand_dist.values,
-            names=brand_dist.index,
-            title="Top 10 Brands"
+        brand_dist = dashboard_aggs["brand_dist"]
+        fig = build_pie_chart(
+            tuple(brand_dist.index),
+            tuple(brand_dist.values),
+            "Top 10 Brands",
+            height=400
         )
-        fig.update_layout(height=400)
         st.plotly_chart(fig, use_container_width=True)
     
     st.markdown("---")
@@ -203,27 +349,27 @@ if page == "🏠 Dashboard":
     
     with col1:
         st.markdown("#### Price Distribution")
-        fig = px.histogram(
-            df,
-            x="selling_price",
-            nbins=30,
-            title="Price Distribution (Selling Price)",
-            labels={'selling_price': 'Price (₹)', 'count': 'Frequency'}
+        counts, edges = dashboard_aggs["price_hist"]
+        fig = build_histogram_chart(
+            tuple(counts),
+            tuple(edges),
+            "Price Distribution (Selling Price)",
+            "Price (₹)",
+            height=300
         )
-        fig.update_layout(height=300)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("#### Average Price by Supplier")
-        supplier_avg = df.groupby("supplier_name")["selling_price"].mean().sort_values()
-        fig = px.bar(
-            x=supplier_avg.values,
-            y=supplier_avg.index,
+        supplier_avg = dashboard_aggs["supplier_avg"]
+        fig = build_bar_chart(
+            tuple(supplier_avg.index),
+            tuple(supplier_avg.values),
+            "Average Price by Supplier",
+            axis_labels={'x': 'Average Price (₹)', 'y': 'Supplier'},
             orientation='h',
-            title="Average Price by Supplier",
-            labels={'x': 'Average Price (₹)', 'y': 'Supplier'}
+            height=300
         )
-        fig.update_layout(height=300)
         st.plotly_chart(fig, use_container_width=True)
 
 
@@ -241,23 +387,26 @@ elif page == "📦 Product Catalog":
         search_query = st.text_input("🔍 Search Products", placeholder="e.g., Rice, Milk, Oil...")
     
     with col2:
-        selected_category = st.selectbox("📂 Filter by Category", ["All"] + catalog.get_all_categories())
+        selected_category = st.selectbox("📂 Filter by Category", ["All"] + catalog.categories)
     
     with col3:
-        selected_brand = st.selectbox("🏷️ Filter by Brand", ["All"] + catalog.get_all_suppliers()[:20])
+        selected_brand = st.selectbox("🏷️ Filter by Brand", ["All"] + catalog.top_suppliers)
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters as a single combined mask (no copy when no filter is set)
+    filters_active = bool(search_query) or selected_category != "All" or selected_brand != "All"
+    mask = np.ones(len(df), dtype=bool)
     
     if search_query:
-        search_results = catalog.search_products(search_query)
-        filtered_df = filtered_df[filtered_df["product_id"].isin(search_results["product_id"])]
+        search_ids = search_product_ids(catalog, search_query, data_version)
+        mask &= df["product_id"].isin(search_ids).to_numpy()
     
     if selected_category != "All":
-        filtered_df = filtered_df[filtered_df["category"] == selected_category]
+        mask &= (df["category"] == selected_category).to_numpy()
     
     if selected_brand != "All":
-        filtered_df = filtered_df[filtered_df["supplier_name"] == selected_brand]
+        mask &= (df["supplier_name"] == selected_brand).to_numpy()
+    
+    filtered_df = df[mask] if filters_active else df
     
     # Display results
     st.markdown(f"**Total Products Found:** {filtered_df['product_id'].nunique()}")
@@ -268,15 +417,16 @@ elif page == "📦 Product Catalog":
         
         with col1:
             st.markdown("#### Products by Category")
-            cat_counts = filtered_df["category"].value_counts()
-            fig = px.bar(x=cat_counts.index, y=cat_counts.values, title="Count by Category")
-            fig.update_layout(height=300)
+            cat_counts = (
+                filtered_df.groupby("category", observed=True, sort=False).size().sort_values(ascending=False)
+            )
+            fig = build_bar_chart(tuple(cat_counts.index), tuple(cat_counts.values), "Count by Category", height=300)
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.markdown("#### Price Range")
-            fig = px.box(filtered_df, y="selling_price", title="Price Distribution")
-            fig.update_layout(height=300)
+            box_stats = compute_box_stats(filtered_df["selling_price"].to_numpy())
+            fig = build_box_chart(**box_stats, title="Price Distribution", y_label="Price (₹)", height=300)
             st.plotly_chart(fig, use_container_width=True)
         
         st.markdown("---")
@@ -284,10 +434,15 @@ elif page == "📦 Product Catalog":
         # Detailed Product Table
         st.markdown("#### Product Details")
         
-        display_df = filtered_df[["product_id", "product_name", "category", "brand", 
-                                   "supplier_name", "selling_price", "mrp", "pack_size", "unit"]].copy()
-        display_df = display_df.drop_duplicates(subset=["product_id", "supplier_name"])
-        display_df = display_df.sort_values("selling_price")
+        display_cols = ["product_id", "product_name", "category", "brand",
+                        "supplier_name", "selling_price", "mrp", "pack_size", "unit"]
+        display_df = (
+            filtered_df[display_cols]
+            .groupby(["product_id", "supplier_name"], observed=True, sort=False)
+            .first()
+            .reset_index()[display_cols]
+            .sort_values("selling_price")
+        )
         
         st.dataframe(display_df, use_container_width=True)
     else:
@@ -297,11 +452,11 @@ elif page == "📦 Product Catalog":
     st.markdown("---")
     st.markdown("#### Detailed Product Analysis")
     
-    all_products = df["product_name"].unique()
+    all_products = lookups["products"]
     selected_product = st.selectbox("Select a product for detailed analysis:", all_products)
     
     if selected_product:
-        product_id = df[df["product_name"] == selected_product]["product_id"].values[0]
+        product_id = catalog.name_to_pid[selected_product]
         product_details = catalog.get_product_details(product_id)
         
         col1, col2 = st.columns(2)
@@ -337,13 +492,13 @@ elif page == "💰 Pricing Analysis":
     with col1:
         analysis_product = st.selectbox(
             "Select a product for pricing analysis:",
-            df["product_name"].unique()
+            lookups["products"]
         )
     
     with col2:
         analysis_category = st.selectbox(
             "Or analyze a category:",
-            ["Single Product"] + catalog.get_all_categories()
+            ["Single Product"] + catalog.categories
         )
     
     st.markdown("---")
@@ -374,33 +529,30 @@ elif page == "💰 Pricing Analysis":
         
         with col1:
             st.markdown("#### Average Price by Supplier")
-            supplier_prices = category_data.groupby("supplier_name")["selling_price"].mean().sort_values()
-            fig = px.bar(
-                x=supplier_prices.values,
-                y=supplier_prices.index,
-                orientation='h',
-                title="Supplier Price Comparison"
+            supplier_prices = category_data.groupby("supplier_name", observed=True, sort=False)["selling_price"].mean().sort_values()
+            fig = build_bar_chart(
+                tuple(supplier_prices.index),
+                tuple(supplier_prices.values),
+                "Supplier Price Comparison",
+                orientation='h'
             )
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.markdown("#### Product Subcategories")
-            subcats = category_data.groupby("subcategory").size()
-            fig = px.pie(values=subcats.values, names=subcats.index, title="Subcategory Distribution")
+            subcats = category_data.groupby("subcategory", observed=True, sort=False).size()
+            fig = build_pie_chart(tuple(subcats.index), tuple(subcats.values), "Subcategory Distribution")
             st.plotly_chart(fig, use_container_width=True)
         
         # Discount Analysis
         st.markdown("---")
         st.markdown("#### Discount Analysis")
         
-        category_data_copy = category_data.copy()
-        category_data_copy["discount_pct"] = ((category_data_copy["mrp"] - category_data_copy["selling_price"]) / category_data_copy["mrp"] * 100)
-        
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Avg Discount %", f"{category_data_copy['discount_pct'].mean():.1f}%")
+            st.metric("Avg Discount %", f"{category_data['discount_pct'].mean():.1f}%")
         with col2:
-            st.metric("Max Discount %", f"{category_data_copy['discount_pct'].max():.1f}%")
+            st.metric("Max Discount %", f"{category_data['discount_pct'].max():.1f}%")
         
         # Products table
         st.markdown("#### Products in Category")
@@ -411,8 +563,9 @@ elif page == "💰 Pricing Analysis":
     else:
         st.markdown(f"### 📊 Pricing Analysis: {analysis_product}")
         
-        product_id = df[df["product_name"] == analysis_product]["product_id"].values[0]
-        analysis = pricing_analyzer.analyze_product_pricing(df, product_id)
+        product_id = catalog.name_to_pid[analysis_product]
+        product_pricing = get_product_pricing(pricing_analyzer, df, product_id, data_version)
+        analysis = product_pricing["analysis"]
         
         if "error" not in analysis:
             col1, col2, col3, col4 = st.columns(4)
@@ -443,7 +596,7 @@ elif page == "💰 Pricing Analysis":
             
             # Savings Opportunity
             st.markdown("---")
-            savings = pricing_analyzer.calculate_savings_opportunity(df, product_id)
+            savings = product_pricing["savings"]
             
             if "error" not in savings:
                 st.markdown("#### 💰 Savings Opportunity")
@@ -467,10 +620,12 @@ elif page == "💰 Pricing Analysis":
 elif page == "📊 Market Intelligence":
     st.markdown("### Market Intelligence & Insights")
     
+    market_reports = get_market_intelligence(analytics, data_version)
+    
     # Category Performance
     st.markdown("#### Category Performance Analysis")
     
-    perf_df = analytics.get_category_performance()
+    perf_df = market_reports["category_perf"]
     st.dataframe(perf_df, use_container_width=True)
     
     st.markdown("---")
@@ -478,7 +633,7 @@ elif page == "📊 Market Intelligence":
     # Supplier Performance
     st.markdown("#### Supplier Performance Ranking")
     
-    supplier_perf = analytics.get_supplier_performance()
+    supplier_perf = market_reports["supplier_perf"]
     st.dataframe(supplier_perf, use_container_width=True)
     
     st.markdown("---")
@@ -487,7 +642,7 @@ elif page == "📊 Market Intelligence":
     
     with col1:
         st.markdown("#### Price Competitiveness")
-        competitiveness = analytics.get_price_competitiveness().head(10)
+        competitiveness = market_reports["competitiveness"].head(10)
         
         fig = px.bar(
             competitiveness.reset_index(),
@@ -501,7 +656,7 @@ elif page == "📊 Market Intelligence":
     
     with col2:
         st.markdown("#### Savings Potential")
-        savings = analytics.get_savings_potential().head(10)
+        savings = market_reports["savings"].head(10)
         
         fig = px.bar(
             savings,
@@ -517,7 +672,7 @@ elif page == "📊 Market Intelligence":
     
     # Strategic Products
     st.markdown("#### Strategic Products (High Priority)")
-    strategic = analytics.identify_strategic_products().head(10)
+    strategic = market_reports["strategic"].head(10)
     st.dataframe(strategic, use_container_width=True)
 
 
@@ -540,7 +695,6 @@ elif page == "🎯 Procurement Data":
     
     with col2:
         st.markdown("#### Dataset Summary")
-        summary = catalog.get_catalog_summary()
         
         st.json({
             "Total Records": len(df),
@@ -558,7 +712,7 @@ elif page == "🎯 Procurement Data":
         st.dataframe(cat_avg, use_container_width=True)
         
         # Download button
-        csv = cat_avg.to_csv()
+        csv = to_csv_bytes(cat_avg)
         st.download_button(
             label="📥 Download Category Averages (CSV)",
             data=csv,
@@ -569,9 +723,15 @@ elif page == "🎯 Procurement Data":
     elif export_format == "Supplier Matrix":
         st.markdown("#### Supplier Price Matrix")
         supplier_matrix = analytics.get_supplier_price_table()
-        st.dataframe(supplier_matrix, use_container_width=True)
         
-        csv = supplier_matrix.to_csv()
+        matrix_rows = len(supplier_matrix)
+        if matrix_rows > 1:
+            row_limit = st.slider("Rows to display", 1, matrix_rows, min(50, matrix_rows))
+        else:
+            row_limit = matrix_rows
+        st.dataframe(supplier_matrix.head(row_limit), use_container_width=True)
+        
+        csv = to_csv_bytes(supplier_matrix)
         st.download_button(
             label="📥 Download Supplier Matrix (CSV)",
             data=csv,
@@ -584,7 +744,7 @@ elif page == "🎯 Procurement Data":
         ml_data = analytics.export_for_ml_training()
         st.dataframe(ml_data.head(50), use_container_width=True)
         
-        csv = ml_data.to_csv(index=False)
+        csv = to_csv_bytes(ml_data, index=False)
         st.download_button(
             label="📥 Download ML Dataset (CSV)",
             data=csv,
@@ -609,9 +769,10 @@ elif page == "🎯 Procurement Data":
     
     else:  # Full Dataset
         st.markdown("#### Full Dataset")
-        st.dataframe(df, use_container_width=True)
+        st.dataframe(df.head(500), use_container_width=True)
+        st.caption(f"Preview of the first {min(500, len(df))} of {len(df)} rows — download the CSV for all rows.")
         
-        csv = df.to_csv(index=False)
+        csv = to_csv_bytes(df, index=False)
         st.download_button(
             label="📥 Download Full Dataset (CSV)",
             data=csv,
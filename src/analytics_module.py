@@ -10,9 +10,13 @@ Date: February 2026
 
 import pandas as pd
 import numpy as np
+from collections.abc import Mapping
+from functools import cached_property
 from typing import Dict, List, Tuple
 from datetime import datetime
 
+from .data_loader_ecommerce import convert_to_categorical, downcast_numeric
+
 
 class ProcurementAnalytics:
     """
@@ -27,8 +31,79 @@ class ProcurementAnalytics:
         Args:
             df: Product dataframe
         """
-        self.df = df.copy()
+        # Shallow copy: the conversions replace whole columns, leaving the caller's frame intact
+        self.df = downcast_numeric(convert_to_categorical(df.copy(deep=False)))
         self.analysis_date = datetime.now().strftime("%Y-%m-%d")
+        
+        # Reusable groupings: the key hashing/factorizing happens once
+        self._gb_category = self.df.groupby("category", sort=False, observed=True)
+        self._gb_supplier = self.df.groupby("supplier_name", sort=False, observed=True)
+        self._gb_product = self.df.groupby("product_name", sort=False, observed=True)
+        self._gb_product_id = self.df.groupby("product_id", sort=False, observed=True)
+        
+        # Distinct counts and headline price statistics, computed once
+        self._nunique = {
+            col: self.df[col].nunique()
+            for col in ("product_id", "supplier_name", "category", "brand")
+        }
+        prices = self.df["selling_price"]
+        self._price_stats = {
+            "avg_price": round(prices.mean(), 2),
+            "median_price": round(prices.median(), 2),
+            "price_std_dev": round(prices.std(), 2)
+        }
+        
+        # Fused aggregates, filled by _compute_all() and _product_stats()
+        self._cache = {}
+        self._ml_data = None
+
+    def _compute_all(self) -> Dict[str, pd.DataFrame]:
+        """
+        Run the category- and supplier-keyed aggregations once each.
+        
+        Every category and supplier report is a column slice of these frames,
+        so the full dataset is scanned once per key instead of once per report.
+        
+        Returns:
+            Dictionary with cached "category" and "supplier" aggregate frames
+        """
+        if "category" not in self._cache:
+            self._cache["category"] = self._gb_category.agg(**{
+                "Products": ("product_id", "nunique"),
+                "Suppliers": ("supplier_name", "nunique"),
+                "Avg Price": ("selling_price", "mean"),
+                "Median Price": ("selling_price", "median"),
+                "Price Variance": ("selling_price", "std"),
+                "Min Price": ("selling_price", "min"),
+                "Max Price": ("selling_price", "max"),
+                "Avg MRP": ("mrp", "mean"),
+                "Brands": ("brand", "nunique")
+            }).round(2)
+            
+            self._cache["supplier"] = self._gb_supplier.agg(**{
+                "Products": ("product_id", "nunique"),
+                "Avg Price": ("selling_price", "mean"),
+                "Min Price": ("selling_price", "min"),
+                "Max Price": ("selling_price", "max"),
+                "Brands": ("brand", "nunique"),
+                "Categories": ("category", "nunique")
+            }).round(2)
+        
+        return self._cache
+
+    def _product_stats(self) -> pd.DataFrame:
+        """Get per-product price statistics from one cached groupby pass"""
+        if "product" not in self._cache:
+            self._cache["product"] = self._gb_product.agg(**{
+                "Supplier Count": ("supplier_name", "nunique"),
+                "Avg Price": ("selling_price", "mean"),
+                "Price Variance": ("selling_price", "std"),
+                "Min Price": ("selling_price", "min"),
+                "Max Price": ("selling_price", "max"),
+                "Records": ("product_id", "count")
+            }).round(2)
+        
+        return self._cache["product"]
 
     def get_market_overview(self) -> Dict:
         """
@@ -38,13 +113,11 @@ class ProcurementAnalytics:
             Dictionary with market metrics
         """
         return {
-            "total_products": self.df["product_id"].nunique(),
-            "total_suppliers": self.df["supplier_name"].nunique(),
-            "categories": self.df["category"].nunique(),
-            "brands": self.df["brand"].nunique(),
-            "avg_price": round(self.df["selling_price"].mean(), 2),
-            "median_price": round(self.df["selling_price"].median(), 2),
-            "price_std_dev": round(self.df["selling_price"].std(), 2),
+            "total_products": self._nunique["product_id"],
+            "total_suppliers": self._nunique["supplier_name"],
+            "categories": self._nunique["category"],
+            "brands": self._nunique["brand"],
+            **self._price_stats,
             "analysis_date": self.analysis_date
         }
 
@@ -55,19 +128,11 @@ class ProcurementAnalytics:
         Returns:
             DataFrame with category metrics
         """
-        performance = self.df.groupby("category").agg({
-            "product_id": "nunique",
-            "supplier_name": "nunique",
-            "selling_price": ["mean", "min", "max"],
-            "mrp": "mean",
-            "brand": "nunique"
-        }).round(2)
-        
-        performance.columns = [
+        performance = self._compute_all()["category"][[
             "Products", "Suppliers", "Avg Price", "Min Price", "Max Price", "Avg MRP", "Brands"
-        ]
+        ]]
         
-        return performance.sort_values("Products", ascending=False)
+        return performance.sort_values(["Products", "category"], ascending=[False, True])
 
     def get_supplier_performance(self) -> pd.DataFrame:
         """
@@ -76,16 +141,7 @@ class ProcurementAnalytics:
         Returns:
             DataFrame with supplier metrics
         """
-        performance = self.df.groupby("supplier_name").agg({
-            "product_id": "nunique",
-            "selling_price": ["mean", "min", "max"],
-            "brand": "nunique",
-            "category": "nunique"
-        }).round(2)
-        
-        performance.columns = [
-            "Products", "Avg Price", "Min Price", "Max Price", "Brands", "Categories"
-        ]
+        performance = self._compute_all()["supplier"].copy()
         
         # Add supplier rankings
         performance["Price Competitiveness"] = (
@@ -93,7 +149,7 @@ class ProcurementAnalytics:
             (performance["Avg Price"].max() - performance["Avg Price"].min()) * 100
         ).round(1)
         
-        return performance.sort_values("Price Competitiveness", ascending=False)
+        return performance.sort_values(["Price Competitiveness", "supplier_name"], ascending=[False, True])
 
     def get_brand_analysis(self, category: str = None) -> pd.DataFrame:
         """
@@ -107,16 +163,22 @@ class ProcurementAnalytics:
         """
         data = self.df if category is None else self.df[self.df["category"] == category]
         
-        brand_analysis = data.groupby("brand").agg({
-            "product_id": "nunique",
-            "selling_price": ["mean", "min", "max"],
-            "supplier_name": "nunique",
-            "category": lambda x: ", ".join(x.unique()[:2])
+        brand_analysis = data.groupby("brand", sort=False, observed=True).agg(**{
+            "Products": ("product_id", "nunique"),
+            "Avg Price": ("selling_price", "mean"),
+            "Min Price": ("selling_price", "min"),
+            "Max Price": ("selling_price", "max"),
+            "Suppliers": ("supplier_name", "nunique")
         }).round(2)
         
-        brand_analysis.columns = ["Products", "Avg Price", "Min Price", "Max Price", "Suppliers", "Categories"]
+        # First two distinct categories per brand, in order of appearance
+        brand_categories = data[["brand", "category"]].drop_duplicates()
+        brand_categories = brand_categories.groupby("brand", sort=False, observed=True).head(2)
+        brand_analysis["Categories"] = brand_categories.groupby(
+            "brand", sort=False, observed=True
+        )["category"].agg(", ".join)
         
-        return brand_analysis.sort_values("Products", ascending=False)
+        return brand_analysis.sort_values(["Products", "brand"], ascending=[False, True])
 
     def calculate_avg_category_prices(self) -> pd.DataFrame:
         """
@@ -125,14 +187,9 @@ class ProcurementAnalytics:
         Returns:
             DataFrame with category averages for procurement
         """
-        category_prices = self.df.groupby("category").agg({
-            "selling_price": ["mean", "median", "std", "min", "max"],
-            "product_id": "nunique"
-        }).round(2)
-        
-        category_prices.columns = [
-            "Avg Price", "Median Price", "Price Variance", "Min", "Max", "Products"
-        ]
+        category_prices = self._compute_all()["category"][[
+            "Avg Price", "Median Price", "Price Variance", "Min Price", "Max Price", "Products"
+        ]].rename(columns={"Min Price": "Min", "Max Price": "Max"}).sort_index()
         
         return category_prices
 
@@ -143,13 +200,13 @@ class ProcurementAnalytics:
         Returns:
             DataFrame with supplier pricing matrix
         """
-        # Create pivot table: Products x Suppliers
-        price_matrix = self.df.pivot_table(
-            values="selling_price",
-            index="product_name",
-            columns="supplier_name",
-            aggfunc="mean"
-        ).round(2)
+        # Products x Suppliers: grouped means reshaped into a dense matrix
+        price_matrix = (
+            self.df.groupby(["product_name", "supplier_name"], observed=True)["selling_price"]
+            .mean()
+            .round(2)
+            .unstack("supplier_name")
+        )
         
         return price_matrix
 
@@ -157,17 +214,12 @@ class ProcurementAnalytics:
         """
         Generate AI-ready procurement dataset.
         
+        Sections are computed lazily, on first access.
+        
         Returns:
-            Dictionary with structured procurement data
+            Read-only mapping with structured procurement data
         """
-        return {
-            "category_averages": self.calculate_avg_category_prices().to_dict(),
-            "supplier_comparison": self.get_supplier_price_table().to_dict(),
-            "category_performance": self.get_category_performance().to_dict(),
-            "supplier_rankings": self.get_supplier_performance().to_dict(),
-            "market_overview": self.get_market_overview(),
-            "dataset_date": self.analysis_date
-        }
+        return ProcurementDataset(self)
 
     def get_price_competitiveness(self) -> pd.DataFrame:
         """
@@ -176,18 +228,16 @@ class ProcurementAnalytics:
         Returns:
             DataFrame with competitiveness scores
         """
-        competitiveness = self.df.groupby("product_name").agg({
-            "selling_price": ["mean", "std", "min", "max"]
-        }).round(2)
-        
-        competitiveness.columns = ["Avg Price", "Price Variance", "Min Price", "Max Price"]
+        competitiveness = self._product_stats()[["Avg Price", "Price Variance", "Min Price", "Max Price"]]
         
         # Calculate competitiveness: high variance = competitive market
         competitiveness["Competitiveness Score"] = (
             competitiveness["Price Variance"] / competitiveness["Avg Price"] * 100
         ).round(2)
         
-        return competitiveness.sort_values("Competitiveness Score", ascending=False)
+        return competitiveness.sort_values(
+            ["Competitiveness Score", "product_name"], ascending=[False, True]
+        )
 
     def get_market_concentration(self) -> Dict[str, float]:
         """
@@ -196,21 +246,24 @@ class ProcurementAnalytics:
         Returns:
             Dictionary with concentration metrics by category
         """
-        concentration = {}
-        
-        for category in self.df["category"].unique():
-            category_data = self.df[self.df["category"] == category]
-            
-            # Market share by supplier
-            supplier_shares = (
-                category_data.groupby("supplier_name").size() / len(category_data) * 100
-            )
-            
-            # HHI = sum of squared market shares
-            hhi = (supplier_shares ** 2).sum()
-            concentration[category] = round(hhi, 2)
-        
-        return concentration
+        categories = self.df["category"].cat
+        suppliers = self.df["supplier_name"].cat
+        cat_codes = categories.codes.to_numpy()
+        sup_codes = suppliers.codes.to_numpy()
+        valid = (cat_codes >= 0) & (sup_codes >= 0)
+        
+        # Row counts per (category, supplier) from one linear pass over integer pair keys
+        n_cat, n_sup = len(categories.categories), len(suppliers.categories)
+        pair_keys = cat_codes[valid].astype(np.int64) * n_sup + sup_codes[valid]
+        counts = np.bincount(pair_keys, minlength=n_cat * n_sup).reshape(n_cat, n_sup)
+        totals = counts.sum(axis=1)
+        observed = totals > 0
+        
+        # HHI = sum of squared market shares
+        shares = counts[observed] * 100.0 / totals[observed, None]
+        hhi = np.round(np.square(shares).sum(axis=1), 2)
+        
+        return dict(zip(categories.categories[observed], hhi.tolist()))
 
     def identify_strategic_products(self) -> pd.DataFrame:
         """
@@ -222,13 +275,7 @@ class ProcurementAnalytics:
         Returns:
             DataFrame with strategic product ranking
         """
-        strategic = self.df.groupby("product_name").agg({
-            "supplier_name": "nunique",
-            "selling_price": ["mean", "std"],
-            "product_id": "count"
-        }).round(2)
-        
-        strategic.columns = ["Supplier Count", "Avg Price", "Price Variance", "Records"]
+        strategic = self._product_stats()[["Supplier Count", "Avg Price", "Price Variance", "Records"]]
         
         # Strategic importance = suppliers * variance / avg price
         strategic["Strategic Score"] = (
@@ -236,7 +283,7 @@ class ProcurementAnalytics:
             (strategic["Price Variance"] / strategic["Avg Price"]) * 100
         ).round(2)
         
-        return strategic.sort_values("Strategic Score", ascending=False)
+        return strategic.sort_values(["Strategic Score", "product_name"], ascending=[False, True])
 
     def get_savings_potential(self) -> pd.DataFrame:
         """
@@ -245,55 +292,124 @@ class ProcurementAnalytics:
         Returns:
             DataFrame with savings analysis
         """
-        savings_data = []
-        
-        for product_id in self.df["product_id"].unique():
-            product_data = self.df[self.df["product_id"] == product_id]
-            max_price = product_data["selling_price"].max()
-            min_price = product_data["selling_price"].min()
-            avg_price = product_data["selling_price"].mean()
-            
-            if max_price > min_price:
-                savings_pct = ((max_price - min_price) / max_price) * 100
-                savings_data.append({
-                    "product_name": product_data.iloc[0]["product_name"],
-                    "category": product_data.iloc[0]["category"],
-                    "current_max_price": round(max_price, 2),
-                    "best_price": round(min_price, 2),
-                    "savings_per_unit": round(max_price - min_price, 2),
-                    "savings_percentage": round(savings_pct, 2)
-                })
-        
-        return pd.DataFrame(savings_data).sort_values("savings_percentage", ascending=False)
+        savings = self._gb_product_id.agg(
+            product_name=("product_name", "first"),
+            category=("category", "first"),
+            current_max_price=("selling_price", "max"),
+            best_price=("selling_price", "min")
+        )
+        
+        savings = savings[savings["current_max_price"] > savings["best_price"]].copy()
+        savings["savings_per_unit"] = savings["current_max_price"] - savings["best_price"]
+        savings["savings_percentage"] = savings["savings_per_unit"] / savings["current_max_price"] * 100
+        savings = savings.round(2)
+        
+        return savings.sort_values(
+            ["savings_percentage", "product_id"], ascending=[False, True]
+        ).reset_index(drop=True)
 
     def export_for_ml_training(self) -> pd.DataFrame:
         """
         Export data in format suitable for ML model training.
         
+        The feature frame is built on first call and reused afterwards.
+        
         Returns:
             DataFrame optimized for ML
         """
-        ml_data = self.df.copy()
+        if self._ml_data is None:
+            self._ml_data = self._build_ml_features()
         
-        # Add engineered features
-        ml_data["discount_pct"] = (
-            (ml_data["mrp"] - ml_data["selling_price"]) / ml_data["mrp"] * 100
-        ).round(2)
-        
-        ml_data["price_per_gram_equivalent"] = (
-            ml_data["selling_price"] / ml_data["pack_size"]
-        ).round(4)
-        
-        ml_data["is_branded"] = ml_data["brand"].notna().astype(int)
+        return self._ml_data
+
+    def _build_ml_features(self) -> pd.DataFrame:
+        """Build the ML feature frame with engineered columns"""
+        ml_data = self.df[[
+            "product_id", "product_name", "category", "subcategory", "brand",
+            "supplier_name", "selling_price", "mrp", "pack_size", "unit"
+        ]].copy()
+        
+        mrp = ml_data["mrp"].to_numpy()
+        price = ml_data["selling_price"].to_numpy()
+        pack_size = ml_data["pack_size"].to_numpy()
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Add engineered features
+            ml_data["discount_pct"] = np.round((mrp - price) / mrp * 100, 2)
+            ml_data["price_per_gram_equivalent"] = np.round(price / pack_size, 4)
+            ml_data["is_branded"] = ml_data["brand"].notna().astype(int)
+            
+            # Normalize numeric features
+            lo, hi = np.nanmin(price), np.nanmax(price)
+            ml_data["price_normalized"] = np.round((price - lo) / (hi - lo), 4)
         
-        # Normalize numeric features
-        ml_data["price_normalized"] = (
-            (ml_data["selling_price"] - ml_data["selling_price"].min()) /
-            (ml_data["selling_price"].max() - ml_data["selling_price"].min())
-        ).round(4)
+        return ml_data
+
+
+class ProcurementDataset(Mapping):
+    """
+    AI-ready procurement dataset with lazily computed sections.
+    
+    Behaves like a read-only dictionary; each section is computed on first
+    access, so callers reading a single key never pay for the others.
+    """
+
+    KEYS = (
+        "category_averages", "supplier_comparison", "category_performance",
+        "supplier_rankings", "market_overview", "dataset_date"
+    )
+
+    def __init__(self, analytics: ProcurementAnalytics):
+        """
+        Initialize dataset view.
         
-        return ml_data[[
-            "product_id", "product_name", "category", "subcategory", "brand",
-            "supplier_name", "selling_price", "mrp", "pack_size", "unit",
-            "discount_pct", "price_per_gram_equivalent", "is_branded", "price_normalized"
-        ]]
+        Args:
+            analytics: Analytics engine the sections are computed from
+        """
+        self._analytics = analytics
+
+    @cached_property
+    def category_averages(self) -> Dict:
+        """Category price averages for procurement planning"""
+        return self._analytics.calculate_avg_category_prices().to_dict()
+
+    @cached_property
+    def supplier_comparison(self) -> Dict:
+        """Products x suppliers price matrix"""
+        return self._analytics.get_supplier_price_table().to_dict()
+
+    @cached_property
+    def category_performance(self) -> Dict:
+        """Category performance metrics"""
+        return self._analytics.get_category_performance().to_dict()
+
+    @cached_property
+    def supplier_rankings(self) -> Dict:
+        """Supplier performance rankings"""
+        return self._analytics.get_supplier_performance().to_dict()
+
+    @cached_property
+    def market_overview(self) -> Dict:
+        """High-level market overview"""
+        return self._analytics.get_market_overview()
+
+    @property
+    def dataset_date(self) -> str:
+        """Date the analysis was generated"""
+        return self._analytics.analysis_date
+
+    def __getitem__(self, key: str):
+        """Get a section by key, computing it on first access"""
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def to_dict(self) -> Dict:
+        """Materialize every section into a plain dictionary"""
+        return {key: self[key] for key in self.KEYS}
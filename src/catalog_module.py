@@ -9,9 +9,17 @@ Date: February 2026
 """
 
 import pandas as pd
+from collections import defaultdict
 from typing import List, Dict, Optional, Tuple
 import numpy as np
 
+from .data_loader_ecommerce import convert_to_categorical, downcast_numeric
+
+
+SEARCH_FIELDS = ["product_name", "brand", "category", "subcategory"]
+NGRAM_SIZE = 3
+LOOKUP_FIELDS = ["category", "subcategory", "brand", "product_id", "product_name"]
+
 
 class ProductCatalog:
     """
@@ -26,32 +34,112 @@ class ProductCatalog:
         Args:
             df: DataFrame containing product information
         """
-        self.df = df.copy()
+        # Shallow copy: the conversions replace whole columns, leaving the caller's frame intact
+        self.df = downcast_numeric(convert_to_categorical(df.copy(deep=False)))
         self.total_products = len(df["product_id"].unique())
         self.total_suppliers = df["supplier_name"].nunique()
+        
+        # Product name -> product ID lookup (first occurrence wins)
+        first_rows = self.df.drop_duplicates(subset=["product_name"])
+        self.name_to_pid = dict(zip(first_rows["product_name"], first_rows["product_id"]))
+        
+        # Dropdown option lists, computed once
+        self.categories = self._sorted_values("category")
+        # Name order first, then a stable count sort, so ties at the top-20 cut are deterministic
+        supplier_counts = self.df["supplier_name"].value_counts().sort_index().sort_values(ascending=False, kind="stable")
+        self.top_suppliers = sorted(supplier_counts[supplier_counts > 0].index[:20].tolist())
+        
+        # Reusable groupings: the key hashing/factorizing happens once
+        self._gb_category = self.df.groupby("category", sort=False, observed=True)
+        self._gb_product = self.df.groupby("product_name", sort=False, observed=True)
+        
+        # Value -> row positions (ascending) for O(1) exact-match lookups
+        self._row_index = {
+            "category": self._gb_category.indices,
+            "product_name": self._gb_product.indices,
+        }
+        for col in LOOKUP_FIELDS:
+            if col not in self._row_index:
+                self._row_index[col] = self.df.groupby(col, sort=False, observed=True).indices
+        
+        self._summary = None
+        self._build_search_index()
+
+    def _positions(self, column: str, value) -> np.ndarray:
+        """Get row positions where a lookup column equals value"""
+        return self._row_index[column].get(value, np.empty(0, dtype=np.intp))
+
+    def _rows(self, column: str, value) -> pd.DataFrame:
+        """Get rows where a lookup column equals value, in original order"""
+        return self.df.iloc[self._positions(column, value)]
+
+    def _sorted_values(self, column: str) -> List[str]:
+        """Get sorted distinct values of a column (O(k) for categorical columns)"""
+        series = self.df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            observed = np.unique(series.cat.codes.to_numpy())
+            observed = observed[observed >= 0]
+            return sorted(series.cat.categories[observed].tolist())
+        return sorted(series.dropna().unique().tolist())
+
+    def _field_text(self, column: str) -> pd.Series:
+        """Get a column as text with missing values blanked (not the string "nan")"""
+        series = self.df[column]
+        # Mask after astype(str): fillna("") first would fail on categorical columns
+        return series.astype(str).where(series.notna(), "")
+
+    def _build_search_index(self) -> None:
+        """
+        Build a trigram inverted index over the searchable text of each row.
+        
+        Maps every lowercase 3-gram to the set of row positions containing it,
+        so a query only verifies rows sharing all of its trigrams.
+        """
+        text = self._field_text(SEARCH_FIELDS[0])
+        for col in SEARCH_FIELDS[1:]:
+            text = text + "\x1f" + self._field_text(col)
+        
+        # Single lowercase haystack per row; fields separated by \x1f
+        self._search_blob = text.str.lower().reset_index(drop=True)
+        self._search_text = self._search_blob.tolist()
+        
+        self._ngram_index = defaultdict(set)
+        for position, row_text in enumerate(self._search_text):
+            for i in range(len(row_text) - NGRAM_SIZE + 1):
+                self._ngram_index[row_text[i:i + NGRAM_SIZE]].add(position)
+
+    def _match_positions(self, query_lower: str) -> List[int]:
+        """Get sorted row positions whose searchable text contains the query"""
+        if len(query_lower) < NGRAM_SIZE:
+            # Too short for the trigram index: one vectorized scan of the haystack
+            matches = self._search_blob.str.contains(query_lower, regex=False, na=False)
+            return np.flatnonzero(matches.to_numpy()).tolist()
+        
+        grams = {query_lower[i:i + NGRAM_SIZE] for i in range(len(query_lower) - NGRAM_SIZE + 1)}
+        postings = sorted((self._ngram_index.get(g, set()) for g in grams), key=len)
+        candidates = sorted(set.intersection(*postings))
+        return [p for p in candidates if query_lower in self._search_text[p]]
 
-    def search_products(self, query: str, limit: int = 50) -> pd.DataFrame:
+    def search_products(self, query: str, limit: int = 50, return_ids: bool = False):
         """
         Search products by name, brand, or category.
         
         Args:
             query: Search query
             limit: Maximum results to return
+            return_ids: Return a frozenset of matching product IDs instead of rows
             
         Returns:
-            DataFrame with matching products
+            DataFrame with matching products, or frozenset of product IDs
         """
-        query_lower = query.lower()
+        positions = self._match_positions(query.lower())
         
-        mask = (
-            self.df["product_name"].str.lower().str.contains(query_lower, na=False) |
-            self.df["brand"].str.lower().str.contains(query_lower, na=False) |
-            self.df["category"].str.lower().str.contains(query_lower, na=False) |
-            self.df["subcategory"].str.lower().str.contains(query_lower, na=False)
-        )
+        results = self.df.iloc[positions].drop_duplicates(subset=["product_id"]).head(limit)
+        
+        if return_ids:
+            return frozenset(results["product_id"].tolist())
         
-        results = self.df[mask].drop_duplicates(subset=["product_id"])
-        return results.head(limit)
+        return results
 
     def get_products_by_category(self, category: str) -> pd.DataFrame:
         """
@@ -63,7 +151,7 @@ class ProductCatalog:
         Returns:
             DataFrame with products in category
         """
-        return self.df[self.df["category"] == category].drop_duplicates(subset=["product_id"])
+        return self._rows("category", category).drop_duplicates(subset=["product_id"])
 
     def get_products_by_subcategory(self, subcategory: str) -> pd.DataFrame:
         """
@@ -75,7 +163,7 @@ class ProductCatalog:
         Returns:
             DataFrame with products in subcategory
         """
-        return self.df[self.df["subcategory"] == subcategory].drop_duplicates(subset=["product_id"])
+        return self._rows("subcategory", subcategory).drop_duplicates(subset=["product_id"])
 
     def get_products_by_brand(self, brand: str, category: str = None) -> pd.DataFrame:
         """
@@ -88,12 +176,12 @@ class ProductCatalog:
         Returns:
             DataFrame with products from brand
         """
-        mask = self.df["brand"] == brand
+        positions = self._positions("brand", brand)
         
         if category:
-            mask = mask & (self.df["category"] == category)
+            positions = np.intersect1d(positions, self._positions("category", category), assume_unique=True)
         
-        return self.df[mask].drop_duplicates(subset=["product_id"])
+        return self.df.iloc[positions].drop_duplicates(subset=["product_id"])
 
     def get_brands_by_category(self, category: str) -> List[str]:
         """
@@ -105,12 +193,12 @@ class ProductCatalog:
         Returns:
             Sorted list of brand names
         """
-        brands = self.df[self.df["category"] == category]["brand"].unique()
+        brands = self._rows("category", category)["brand"].unique()
         return sorted(brands.tolist())
 
     def get_all_categories(self) -> List[str]:
         """Get sorted list of all categories"""
-        return sorted(self.df["category"].unique().tolist())
+        return list(self.categories)
 
     def get_all_subcategories(self) -> List[str]:
         """Get sorted list of all subcategories"""
@@ -130,11 +218,11 @@ class ProductCatalog:
         Returns:
             DataFrame with complete product details
         """
-        return self.df[self.df["product_id"] == product_id].sort_values("selling_price")
+        return self._rows("product_id", product_id).sort_values("selling_price")
 
     def get_product_by_name(self, product_name: str) -> pd.DataFrame:
         """Get all suppliers for a product by name"""
-        return self.df[self.df["product_name"] == product_name]
+        return self._rows("product_name", product_name)
 
     def filter_by_price_range(self, min_price: float, max_price: float) -> pd.DataFrame:
         """
@@ -184,22 +272,32 @@ class ProductCatalog:
         Returns:
             DataFrame with top products
         """
-        return self.df.groupby("product_name").agg({
+        return self._gb_product.agg({
             "product_id": "first",
             "category": "first",
             "selling_price": "mean",
             "supplier_name": "count"
         }).rename(columns={"supplier_name": "suppliers_count"}).sort_values(
-            "suppliers_count", ascending=False
+            # product_name breaks ties so the top-N cut is deterministic
+            ["suppliers_count", "product_name"], ascending=[False, True]
         ).head(limit).reset_index()
 
     def get_catalog_summary(self) -> Dict:
         """
         Get comprehensive catalog summary statistics.
         
+        The summary is computed on first call and reused afterwards.
+        
         Returns:
             Dictionary with catalog metrics
         """
+        if self._summary is None:
+            self._summary = self._compute_catalog_summary()
+        
+        return dict(self._summary)
+
+    def _compute_catalog_summary(self) -> Dict:
+        """Compute catalog summary statistics over the full dataframe"""
         return {
             "total_unique_products": self.total_products,
             "total_suppliers": self.total_suppliers,
@@ -242,12 +340,12 @@ class ProductCatalog:
         Returns:
             DataFrame with similar products
         """
-        product = self.df[self.df["product_id"] == product_id].iloc[0]
+        product = self._rows("product_id", product_id).iloc[0]
         
-        similar = self.df[
-            (self.df["subcategory"] == product["subcategory"]) &
-            (self.df["product_id"] != product_id)
-        ].drop_duplicates(subset=["product_id"]).sort_values("selling_price")
+        similar = self._rows("subcategory", product["subcategory"])
+        similar = similar[similar["product_id"] != product_id].drop_duplicates(
+            subset=["product_id"]
+        ).sort_values("selling_price")
         
         return similar[["product_id", "product_name", "brand", "selling_price", "pack_size", "unit"]]
 
@@ -258,9 +356,10 @@ class ProductCatalog:
         Returns:
             Dictionary mapping categories to subcategories
         """
+        subcategories = self._gb_category["subcategory"].unique()
+        
         composition = {}
-        for category in self.get_all_categories():
-            subcats = self.df[self.df["category"] == category]["subcategory"].unique().tolist()
-            composition[category] = sorted(subcats)
+        for category in self.categories:
+            composition[category] = sorted(pd.unique(subcategories[category]).tolist())
         
         return composition
@@ -8,10 +8,31 @@ Author: AI Procurement Platform Team
 Date: February 2026
 """
 
+import re
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 
 
+# Keyword -> subcategory hints, checked in order
+SUBCATEGORY_KEYWORDS = {
+    "basmati": "Basmati",
+    "red": "Red Lentils",
+    "moong": "Moong Dal",
+    "paneer": "Paneer",
+    "curd": "Curd",
+    "chips": "Potato Chips",
+    "tea": "Tea",
+    "coffee": "Coffee",
+    "shampoo": "Hair Care",
+    "toothpaste": "Oral Care",
+    "detergent": "Laundry Detergent",
+    "noodle": "Instant Noodles",
+    "cereal": "Breakfast Cereals",
+}
+
+DEFAULT_CATEGORY = ("Other Products", "Uncategorized")
+
+
 class CategoryMappingEngine:
     """
     Intelligent category mapping engine for Indian grocery and FMCG products.
@@ -94,6 +115,13 @@ class CategoryMappingEngine:
                 "subcategories": ["Paper Products", "Storage", "Kitchen Essentials"]
             }
         }
+        
+        # One compiled alternation per category, tried in category order so the
+        # first category with any keyword wins (same precedence as a nested loop)
+        self._category_patterns = [
+            (category, re.compile("|".join(re.escape(k) for k in details["keywords"])))
+            for category, details in self.categories.items()
+        ]
 
     def categorize_product(self, product_name: str) -> Tuple[str, str]:
         """
@@ -108,15 +136,56 @@ class CategoryMappingEngine:
         product_lower = product_name.lower()
         
         # Find matching category
-        for category, details in self.categories.items():
-            for keyword in details["keywords"]:
-                if keyword in product_lower:
-                    # Select subcategory based on specific keywords
-                    subcategory = self._select_subcategory(product_lower, details["subcategories"])
-                    return category, subcategory
+        for category, pattern in self._category_patterns:
+            if pattern.search(product_lower):
+                # Select subcategory based on specific keywords
+                subcategory = self._select_subcategory(product_lower, self.categories[category]["subcategories"])
+                return category, subcategory
         
         # Default category if no match found
-        return "Other Products", "Uncategorized"
+        return DEFAULT_CATEGORY
+
+    def categorize_series(self, product_names: pd.Series) -> pd.DataFrame:
+        """
+        Categorize many products at once using vectorized string matching.
+        
+        Gives the same result as calling categorize_product on each name, but
+        runs one column-wide regex scan per category instead of a Python loop
+        per product.
+        
+        Args:
+            product_names: Series of product names
+            
+        Returns:
+            DataFrame with 'category' and 'subcategory' columns, aligned to the input index
+        """
+        names_lower = product_names.fillna("").astype(str).str.lower()
+        
+        category = pd.Series(DEFAULT_CATEGORY[0], index=product_names.index, dtype=object)
+        subcategory = pd.Series(DEFAULT_CATEGORY[1], index=product_names.index, dtype=object)
+        unassigned = pd.Series(True, index=product_names.index)
+        
+        for cat_name, pattern in self._category_patterns:
+            matched = unassigned & names_lower.str.contains(pattern, na=False)
+            if not matched.any():
+                continue
+            
+            subcategories = self.categories[cat_name]["subcategories"]
+            category[matched] = cat_name
+            subcategory[matched] = subcategories[0] if subcategories else "General"
+            
+            # Keyword hints, first match wins
+            open_rows = matched.copy()
+            for keyword, subcat in SUBCATEGORY_KEYWORDS.items():
+                if subcat not in subcategories:
+                    continue
+                hit = open_rows & names_lower.str.contains(keyword, regex=False)
+                subcategory[hit] = subcat
+                open_rows &= ~hit
+            
+            unassigned &= ~matched
+        
+        return pd.DataFrame({"category": category, "subcategory": subcategory})
 
     def _select_subcategory(self, product_name: str, subcategories: List[str]) -> str:
         """
@@ -130,23 +199,7 @@ class CategoryMappingEngine:
             Selected subcategory
         """
         # Simple keyword matching for subcategories
-        keyword_subcategory_map = {
-            "basmati": "Basmati",
-            "red": "Red Lentils",
-            "moong": "Moong Dal",
-            "paneer": "Paneer",
-            "curd": "Curd",
-            "chips": "Potato Chips",
-            "tea": "Tea",
-            "coffee": "Coffee",
-            "shampoo": "Hair Care",
-            "toothpaste": "Oral Care",
-            "detergent": "Laundry Detergent",
-            "noodle": "Instant Noodles",
-            "cereal": "Breakfast Cereals",
-        }
-        
-        for keyword, subcat in keyword_subcategory_map.items():
+        for keyword, subcat in SUBCATEGORY_KEYWORDS.items():
             if keyword in product_name and subcat in subcategories:
                 return subcat
         
@@ -9,17 +9,78 @@ Date: February 2026
 """
 
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import os
 from typing import Optional, List, Dict
 from pathlib import Path
 
 
+# Repeated text columns stored as pandas categoricals (small integer codes)
+CATEGORICAL_COLUMNS = ("category", "subcategory", "brand", "supplier_name", "unit")
+
+
+def convert_to_categorical(df: pd.DataFrame, columns=CATEGORICAL_COLUMNS) -> pd.DataFrame:
+    """
+    Convert repeated text columns to categorical dtype in place.
+    
+    Columns that are missing or already categorical are left untouched.
+    
+    Args:
+        df: Product dataframe
+        columns: Column names to convert
+        
+    Returns:
+        The same dataframe, for chaining
+    """
+    for col in columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+# Numeric columns narrowed to the smallest dtype of each kind that holds their values;
+# prices stay float64 because they are averaged and rounded for display
+DOWNCAST_COLUMNS = {
+    "product_id": "integer",
+}
+
+
+def downcast_numeric(df: pd.DataFrame, columns: Dict[str, str] = DOWNCAST_COLUMNS) -> pd.DataFrame:
+    """
+    Downcast numeric columns in place (float64 -> float32, int64 -> int32/int16).
+    
+    Columns that are missing or not numeric are left untouched.
+    
+    Args:
+        df: Product dataframe
+        columns: Mapping of column name to downcast kind ("float" or "integer")
+        
+    Returns:
+        The same dataframe, for chaining
+    """
+    for col, kind in columns.items():
+        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast=kind)
+    return df
+
+
 class IndianEcommerceCatalogLoader:
     """
     Loads and processes Indian e-commerce product catalogs.
     Supports CSV data and provides data validation and cleaning.
     """
 
+    # Parse schema applied at read time (repeated text columns as categoricals)
+    CSV_DTYPES = {
+        "category": "category",
+        "subcategory": "category",
+        "brand": "category",
+        "supplier_name": "category",
+        "unit": "category",
+    }
+
     def __init__(self, csv_path: str):
         """
         Initialize loader.
@@ -28,18 +89,26 @@ class IndianEcommerceCatalogLoader:
             csv_path: Path to CSV file
         """
         self.csv_path = csv_path
+        self.cache_path = Path(csv_path).with_suffix(".parquet")
         self.df = None
-        self.original_df = None
         self._load_and_validate()
 
+    @property
+    def original_df(self) -> pd.DataFrame:
+        """Raw, uncleaned CSV contents (re-read on access rather than kept in memory)"""
+        return pd.read_csv(self.csv_path, engine="pyarrow", dtype=self.CSV_DTYPES)
+
     def _load_and_validate(self) -> None:
         """Load and validate data"""
         if not os.path.exists(self.csv_path):
             raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
         
+        # Cleaned Parquet sidecar from a previous load skips CSV parsing entirely
+        if self._load_cache():
+            return
+        
         try:
-            self.df = pd.read_csv(self.csv_path)
-            self.original_df = self.df.copy()
+            self.df = pd.read_csv(self.csv_path, engine="pyarrow", dtype=self.CSV_DTYPES)
             
             # Validate required columns
             required_cols = [
@@ -57,11 +126,32 @@ class IndianEcommerceCatalogLoader:
             
         except Exception as e:
             raise Exception(f"Error loading CSV: {str(e)}")
+        
+        self._write_cache()
+
+    def _load_cache(self) -> bool:
+        """Load the cleaned Parquet cache if it is at least as new as the CSV"""
+        try:
+            if self.cache_path.stat().st_mtime < os.path.getmtime(self.csv_path):
+                return False
+            self.df = pd.read_parquet(self.cache_path, engine="pyarrow")
+        except (OSError, pa.ArrowException):
+            # Missing, unreadable or corrupt cache: fall back to the CSV
+            return False
+        return True
+
+    def _write_cache(self) -> None:
+        """Write the cleaned dataframe to the Parquet cache (best effort)"""
+        try:
+            self.df.to_parquet(self.cache_path, engine="pyarrow", compression="zstd")
+        except (OSError, pa.ArrowException):
+            # Read-only data directory or unsupported column: keep working from the CSV
+            pass
 
     def _clean_data(self) -> None:
         """Clean and prepare data"""
         # Convert numeric columns
-        self.df["product_id"] = pd.to_numeric(self.df["product_id"], errors="coerce").astype(int)
+        self.df["product_id"] = pd.to_numeric(self.df["product_id"], errors="coerce")
         self.df["mrp"] = pd.to_numeric(self.df["mrp"], errors="coerce")
         self.df["selling_price"] = pd.to_numeric(self.df["selling_price"], errors="coerce")
         self.df["pack_size"] = pd.to_numeric(self.df["pack_size"], errors="coerce")
@@ -69,10 +159,53 @@ class IndianEcommerceCatalogLoader:
         # Remove rows with missing required values
         self.df = self.df.dropna(subset=["product_id", "selling_price", "mrp"])
         
+        # Integer IDs only once unparseable ones are gone, then narrow every numeric column
+        self.df["product_id"] = self.df["product_id"].astype(int)
+        downcast_numeric(self.df)
+        
         # Strip whitespace from string columns
-        string_cols = self.df.select_dtypes(include=['object']).columns
+        string_cols = self.df.select_dtypes(include=['object', 'string']).columns
         for col in string_cols:
-            self.df[col] = self.df[col].str.strip()
+            self.df[col] = self._strip_strings(self.df[col])
+        
+        # Categorical columns only need their (few) category labels stripped
+        category_cols = self.df.select_dtypes(include=['category']).columns
+        for col in category_cols:
+            self.df[col] = self._strip_categories(self.df[col])
+
+    @staticmethod
+    def _strip_strings(series: pd.Series) -> pd.Series:
+        """Strip whitespace from a text column with Arrow's UTF-8 trim kernel"""
+        if series.dtype != object:
+            # Arrow-backed string dtype: .str.strip already runs the Arrow kernel
+            return series.str.strip()
+        
+        try:
+            stripped = pc.utf8_trim_whitespace(pa.array(series, from_pandas=True))
+        except pa.ArrowException:
+            # Mixed or non-text values: fall back to pandas' element-wise strip
+            return series.str.strip()
+        
+        values = np.where(
+            series.isna().to_numpy(), series.to_numpy(), stripped.to_numpy(zero_copy_only=False)
+        )
+        return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+    @staticmethod
+    def _strip_categories(series: pd.Series) -> pd.Series:
+        """Strip whitespace from categorical labels, merging labels that collide"""
+        categories = series.cat.categories.astype(str).str.strip()
+        if categories.is_unique:
+            return series.cat.rename_categories(categories)
+        
+        new_categories, remap = np.unique(categories.to_numpy(), return_inverse=True)
+        codes = series.cat.codes.to_numpy()
+        new_codes = np.where(codes >= 0, remap[codes], -1)
+        return pd.Series(
+            pd.Categorical.from_codes(new_codes, categories=new_categories),
+            index=series.index,
+            name=series.name
+        )
 
     def get_dataframe(self) -> pd.DataFrame:
         """Get processed dataframe"""
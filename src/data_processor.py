@@ -8,15 +8,37 @@ Future phases can replace CSV with database operations.
 """
 
 import pandas as pd
-from typing import Dict, List, Tuple
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 import os
 
+from .data_loader_ecommerce import convert_to_categorical, downcast_numeric
+
+
+# Rows parsed per chunk when streaming the procurement CSV
+CSV_CHUNK_SIZE = 200_000
+
+# Low-cardinality text columns stored as categoricals (integer-coded grouping)
+PROCUREMENT_CATEGORICAL_COLUMNS = ('supplier_name', 'demand_level')
+
+# Integer columns narrowed after load; unit_price stays float64 because raw
+# prices are returned unrounded in supplier maps and recommendations
+PROCUREMENT_DOWNCAST_COLUMNS = {
+    'stock_level': 'integer',
+    'item_id': 'integer',
+}
+
 
 class ProcurementDataLoader:
     """
     Handles loading and caching procurement data from CSV files.
     """
     
+    REQUIRED_COLUMNS = [
+        'item_id', 'item_name', 'supplier_id', 'supplier_name',
+        'unit_price', 'stock_level', 'demand_level', 'last_updated'
+    ]
+    
     def __init__(self, csv_path: str):
         """
         Initialize the data loader.
@@ -26,6 +48,8 @@ class ProcurementDataLoader:
         """
         self.csv_path = csv_path
         self.df = None
+        self._id_to_name = {}
+        self._all_items = None
         self.load_data()
     
     def load_data(self) -> pd.DataFrame:
@@ -43,21 +67,26 @@ class ProcurementDataLoader:
             raise FileNotFoundError(f"Data file not found: {self.csv_path}")
         
         try:
-            self.df = pd.read_csv(self.csv_path)
+            # Stream the file in chunks, keeping only the columns the platform uses
+            required = set(self.REQUIRED_COLUMNS)
+            chunks = pd.read_csv(self.csv_path, chunksize=CSV_CHUNK_SIZE, usecols=lambda col: col in required)
+            self.df = pd.concat(chunks, ignore_index=True)
             
             # Validate required columns
-            required_columns = [
-                'item_id', 'item_name', 'supplier_id', 'supplier_name',
-                'unit_price', 'stock_level', 'demand_level', 'last_updated'
-            ]
-            
-            missing_columns = set(required_columns) - set(self.df.columns)
+            missing_columns = required - set(self.df.columns)
             if missing_columns:
                 raise ValueError(f"Missing required columns: {missing_columns}")
             
             # Convert data types
             self.df['unit_price'] = pd.to_numeric(self.df['unit_price'], errors='coerce')
             self.df['stock_level'] = pd.to_numeric(self.df['stock_level'], errors='coerce')
+            downcast_numeric(self.df, PROCUREMENT_DOWNCAST_COLUMNS)
+            convert_to_categorical(self.df, PROCUREMENT_CATEGORICAL_COLUMNS)
+            
+            # Item lookups, rebuilt on every load (first row per item wins)
+            first_rows = self.df.drop_duplicates(subset=['item_id'])
+            self._id_to_name = dict(zip(first_rows['item_id'], first_rows['item_name']))
+            self._all_items = None
             
             return self.df
         except Exception as e:
@@ -73,8 +102,14 @@ class ProcurementDataLoader:
         if self.df is None:
             return []
         
-        items = self.df[['item_id', 'item_name']].drop_duplicates().sort_values('item_name')
-        return list(zip(items['item_id'], items['item_name']))
+        if self._all_items is None:
+            # One entry per item ID (first row's name), then ordered by name
+            ids, first_rows = np.unique(self.df['item_id'].to_numpy(), return_index=True)
+            names = self.df['item_name'].to_numpy()[first_rows]
+            items = pd.DataFrame({'item_id': ids, 'item_name': names}).sort_values('item_name', kind='stable')
+            self._all_items = list(zip(items['item_id'].tolist(), items['item_name'].tolist()))
+        
+        return list(self._all_items)
     
     def get_item_name_by_id(self, item_id: int) -> str:
         """
@@ -89,8 +124,7 @@ class ProcurementDataLoader:
         if self.df is None:
             return ""
         
-        item = self.df[self.df['item_id'] == item_id]['item_name'].iloc[0] if len(self.df[self.df['item_id'] == item_id]) > 0 else ""
-        return str(item)
+        return str(self._id_to_name.get(item_id, ""))
 
 
 class ItemDataProcessor:
@@ -106,6 +140,65 @@ class ItemDataProcessor:
             df: DataFrame containing procurement data
         """
         self.df = df
+        
+        # Item ID -> row positions, built once so per-item lookups skip a full scan
+        self._item_index = df.groupby('item_id', sort=False).indices
+        self._item_stats = self._compute_item_stats(df)
+    
+    @staticmethod
+    def _compute_item_stats(df: pd.DataFrame) -> Dict[int, Dict]:
+        """
+        Compute summary and price statistics for every item in one grouped pass.
+        
+        Args:
+            df: DataFrame containing procurement data
+            
+        Returns:
+            Dictionary mapping item ID to its statistics
+        """
+        grouped = df.groupby('item_id', sort=False)
+        prices = grouped['unit_price']
+        supplier_count = grouped.size()
+        
+        # Mean price summed over each item's rows in order, as Series.mean() does,
+        # so the rounded averages match a per-item item_data['unit_price'].mean()
+        unit_prices = df['unit_price'].to_numpy(np.float64)
+        positions = grouped.indices
+        avg_price = []
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for item_id in supplier_count.index:
+                item_prices = unit_prices[positions[item_id]]
+                valid = ~np.isnan(item_prices)
+                avg_price.append(np.where(valid, item_prices, 0.0).sum() / valid.sum())
+        
+        stats = pd.DataFrame({
+            'item_name': df.drop_duplicates(subset=['item_id']).set_index('item_id')['item_name'],
+            'supplier_count': supplier_count,
+            'avg_price': pd.Series(avg_price, index=supplier_count.index, dtype=np.float64),
+            'min_price': prices.min(),
+            'max_price': prices.max(),
+            'median_price': prices.median(),
+            'std_price': prices.std(ddof=0),
+            'average_stock': grouped['stock_level'].mean()
+        })
+        stats['price_range'] = stats['max_price'] - stats['min_price']
+        
+        # Cheapest supplier per item: stable sort by (item, price), first row of each item
+        order = np.lexsort((df['unit_price'].to_numpy(), df['item_id'].to_numpy()))
+        cheapest = df.iloc[order].drop_duplicates(subset=['item_id']).set_index('item_id')
+        stats['best_supplier'] = cheapest['supplier_name']
+        stats['best_price'] = cheapest['unit_price']
+        
+        # Most frequent demand level per item (ties go to the first label alphabetically)
+        demand_counts = df.groupby(['item_id', 'demand_level'], observed=True).size()
+        top_demand = demand_counts.groupby(level=0).idxmax()
+        stats['average_demand'] = pd.Series(
+            pd.MultiIndex.from_tuples(top_demand.tolist()).get_level_values(1),
+            index=top_demand.index
+        )
+        stats['average_demand'] = stats['average_demand'].fillna('Unknown')
+        
+        return stats.to_dict('index')
     
     def get_item_data(self, item_id: int) -> pd.DataFrame:
         """
@@ -117,7 +210,8 @@ class ItemDataProcessor:
         Returns:
             DataFrame filtered for the item
         """
-        return self.df[self.df['item_id'] == item_id].copy()
+        positions = self._item_index.get(item_id, np.empty(0, dtype=np.intp))
+        return self.df.iloc[positions]
     
     def get_supplier_prices(self, item_id: int) -> Dict[str, float]:
         """
@@ -129,11 +223,26 @@ class ItemDataProcessor:
         Returns:
             Dictionary mapping supplier names to prices
         """
-        item_data = self.get_item_data(item_id)
-        if item_data.empty:
-            return {}
+        names, prices = self.get_supplier_price_arrays(item_id)
+        return dict(zip(names.tolist(), prices.tolist()))
+    
+    def get_supplier_price_arrays(self, item_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get supplier names and prices for an item as parallel arrays.
+        
+        Args:
+            item_id: The item ID
+            
+        Returns:
+            Tuple of (supplier names, unit prices); both empty if the item is unknown
+        """
+        positions = self._item_index.get(item_id, np.empty(0, dtype=np.intp))
         
-        return dict(zip(item_data['supplier_name'], item_data['unit_price']))
+        # Gather the item's rows of just the two needed columns; take() before
+        # to_numpy() so a categorical column is not materialized in full
+        names = self.df['supplier_name'].take(positions).to_numpy()
+        prices = self.df['unit_price'].take(positions).to_numpy()
+        return names, prices
     
     def get_item_summary(self, item_id: int) -> Dict:
         """
@@ -145,9 +254,9 @@ class ItemDataProcessor:
         Returns:
             Dictionary with item summary data
         """
-        item_data = self.get_item_data(item_id)
+        stats = self._item_stats.get(item_id)
         
-        if item_data.empty:
+        if stats is None:
             return {
                 'item_id': item_id,
                 'item_name': 'Unknown',
@@ -161,21 +270,44 @@ class ItemDataProcessor:
         
         return {
             'item_id': item_id,
-            'item_name': item_data['item_name'].iloc[0],
-            'supplier_count': len(item_data),
-            'avg_price': round(item_data['unit_price'].mean(), 2),
-            'min_price': round(item_data['unit_price'].min(), 2),
-            'max_price': round(item_data['unit_price'].max(), 2),
-            'average_stock': round(item_data['stock_level'].mean(), 1),
-            'average_demand': item_data['demand_level'].mode()[0] if not item_data['demand_level'].empty else 'Unknown'
+            'item_name': stats['item_name'],
+            'supplier_count': stats['supplier_count'],
+            'avg_price': np.round(stats['avg_price'], 2),
+            'min_price': np.round(stats['min_price'], 2),
+            'max_price': np.round(stats['max_price'], 2),
+            'average_stock': np.round(stats['average_stock'], 1),
+            'average_demand': stats['average_demand']
         }
     
-    def get_supplier_comparison_table(self, item_id: int) -> pd.DataFrame:
+    def get_recommendation_inputs(self, item_id: int) -> Dict:
+        """
+        Get precomputed market metrics for generate_recommendation.
+        
+        Args:
+            item_id: The item ID
+            
+        Returns:
+            Dictionary with average_price, best_supplier and best_price
+            (empty if the item is unknown), usable as keyword arguments
+        """
+        stats = self._item_stats.get(item_id)
+        
+        if stats is None:
+            return {}
+        
+        return {
+            'average_price': round(stats['avg_price'], 2),
+            'best_supplier': stats['best_supplier'],
+            'best_price': stats['best_price']
+        }
+    
+    def get_supplier_comparison_table(self, item_id: int, top_n: Optional[int] = None) -> pd.DataFrame:
         """
         Get formatted supplier comparison table for an item.
         
         Args:
             item_id: The item ID
+            top_n: Optional number of cheapest suppliers to keep (partial sort)
             
         Returns:
             DataFrame formatted for display with supplier comparison
@@ -190,10 +322,20 @@ class ItemDataProcessor:
         display_df.columns = ['Supplier ID', 'Supplier Name', 'Unit Price ($)', 'Stock Level', 'Demand']
         
         # Sort by price
-        display_df = display_df.sort_values('Unit Price ($)').reset_index(drop=True)
+        if top_n is None:
+            display_df = display_df.sort_values('Unit Price ($)').reset_index(drop=True)
+        else:
+            display_df = display_df.nsmallest(top_n, 'Unit Price ($)').reset_index(drop=True)
         
         # Format price column
-        display_df['Unit Price ($)'] = display_df['Unit Price ($)'].apply(lambda x: f"${x:.2f}")
+        display_df['Unit Price ($)'] = np.char.add('$', np.char.mod('%.2f', display_df['Unit Price ($)'].to_numpy()))
+        
+        # Hand the table plain text and int64 columns rather than the compact load dtypes
+        for col in ('Supplier Name', 'Demand'):
+            if isinstance(display_df[col].dtype, pd.CategoricalDtype):
+                display_df[col] = display_df[col].astype(display_df[col].cat.categories.dtype)
+        if pd.api.types.is_integer_dtype(display_df['Stock Level']):
+            display_df['Stock Level'] = display_df['Stock Level'].astype(np.int64)
         
         return display_df
     
@@ -207,20 +349,18 @@ class ItemDataProcessor:
         Returns:
             Dictionary with price statistics
         """
-        item_data = self.get_item_data(item_id)
+        stats = self._item_stats.get(item_id)
         
-        if item_data.empty:
+        if stats is None:
             return {}
         
-        prices = item_data['unit_price'].values
-        
         return {
-            'min': round(prices.min(), 2),
-            'max': round(prices.max(), 2),
-            'avg': round(prices.mean(), 2),
-            'median': round(prices.median(), 2),
-            'std': round(prices.std(), 2),
-            'price_range': round(prices.max() - prices.min(), 2)
+            'min': np.round(stats['min_price'], 2),
+            'max': np.round(stats['max_price'], 2),
+            'avg': np.round(stats['avg_price'], 2),
+            'median': np.round(stats['median_price'], 2),
+            'std': np.round(stats['std_price'], 2),
+            'price_range': np.round(stats['price_range'], 2)
         }
 
 
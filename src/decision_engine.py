@@ -11,10 +11,23 @@ Future phases can extend this module with:
 - Risk assessment algorithms
 """
 
-from typing import Dict, List, Tuple
+from bisect import bisect_right
+from functools import reduce
+from typing import Collection, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+import pandas as pd
+
+
+# Stock thresholds: < 50 is Low, < 150 is Medium, otherwise High
+STOCK_THRESHOLDS = (50, 150)
+STOCK_LABELS = ("Low", "Medium", "High")
+
+_STOCK_BINS = np.array(STOCK_THRESHOLDS)
+_STOCK_LABEL_ARRAY = np.array(STOCK_LABELS)
+
 
 class ProcurementDecision(Enum):
     """Enumeration of procurement recommendations"""
@@ -44,20 +57,28 @@ def get_stock_level_category(stock: int) -> str:
     Returns:
         Category as string: 'Low', 'Medium', or 'High'
     """
-    if stock < 50:
-        return "Low"
-    elif stock < 150:
-        return "Medium"
-    else:
-        return "High"
+    return STOCK_LABELS[bisect_right(STOCK_THRESHOLDS, stock)]
+
+
+def get_stock_level_category_vec(stock_levels) -> np.ndarray:
+    """
+    Categorize many stock levels at once.
+    
+    Args:
+        stock_levels: Array-like of stock quantities
+        
+    Returns:
+        Array of categories: 'Low', 'Medium', or 'High'
+    """
+    return _STOCK_LABEL_ARRAY[np.digitize(np.asarray(stock_levels), _STOCK_BINS)]
 
 
-def calculate_average_price(prices: List[float]) -> float:
+def calculate_average_price(prices: Collection[float]) -> float:
     """
     Calculate the average price from multiple suppliers.
     
     Args:
-        prices: List of supplier prices
+        prices: Supplier prices (any sized collection, e.g. dict values)
         
     Returns:
         Average price rounded to 2 decimal places
@@ -94,8 +115,8 @@ def identify_best_supplier(supplier_prices: Dict[str, float]) -> Tuple[str, floa
     if not supplier_prices:
         return ("Unknown", 0.0)
     
-    best_supplier = min(supplier_prices.items(), key=lambda x: x[1])
-    return best_supplier
+    best_supplier = min(supplier_prices, key=supplier_prices.__getitem__)
+    return (best_supplier, supplier_prices[best_supplier])
 
 
 def is_supplier_preferred(supplier_price: float, average_price: float, threshold: float = 0.1) -> bool:
@@ -162,6 +183,67 @@ def make_procurement_decision(
     return ProcurementDecision.WAIT.value
 
 
+# Batch decision codes, indexing into _DECISION_VALUES
+_WAIT, _CONSIDER_BUYING, _BUY_NOW = 0, 1, 2
+_DECISION_VALUES = np.array([
+    ProcurementDecision.WAIT.value,
+    ProcurementDecision.CONSIDER_BUYING.value,
+    ProcurementDecision.BUY_NOW.value
+])
+
+
+def _high_demand_mask(demand_levels) -> np.ndarray:
+    """Get mask of 'High' demand rows, comparing integer codes for categoricals"""
+    if isinstance(demand_levels, pd.Series) and isinstance(demand_levels.dtype, pd.CategoricalDtype):
+        categories = demand_levels.cat.categories
+        if "High" not in categories:
+            return np.zeros(len(demand_levels), dtype=bool)
+        return demand_levels.cat.codes.to_numpy() == categories.get_loc("High")
+    
+    return np.asarray(demand_levels) == "High"
+
+
+def make_procurement_decisions_vec(
+    stock_levels,
+    demand_levels,
+    supplier_prices,
+    average_prices
+) -> np.ndarray:
+    """
+    Make procurement recommendations for many rows at once.
+    
+    Applies the same rules as make_procurement_decision with array-wide
+    boolean masks instead of a Python call per row.
+    
+    Args:
+        stock_levels: Array-like of stock quantities
+        demand_levels: Array-like of demand levels ('Low', 'Medium', 'High')
+        supplier_prices: Array-like of selected supplier prices
+        average_prices: Array-like of average market prices
+        
+    Returns:
+        Array of procurement decisions as strings
+    """
+    stock_codes = np.digitize(np.asarray(stock_levels), _STOCK_BINS)
+    high_demand = _high_demand_mask(demand_levels)
+    preferred = np.asarray(supplier_prices) < np.asarray(average_prices) * (1 - 0.15)
+    
+    codes = np.full(stock_codes.shape, _WAIT, dtype=np.int8)
+    codes[high_demand & (stock_codes == 1)] = _CONSIDER_BUYING
+    codes[high_demand & (stock_codes == 2) & preferred] = _CONSIDER_BUYING
+    codes[high_demand & (stock_codes == 0)] = _BUY_NOW
+    
+    return _DECISION_VALUES[codes]
+
+
+# Closing sentence of the reasoning text for each decision
+_DECISION_MESSAGES = {
+    ProcurementDecision.BUY_NOW.value: "✓ Low inventory with high demand requires immediate procurement.",
+    ProcurementDecision.CONSIDER_BUYING.value: "⚠ Moderate inventory with high demand. Consider purchase if pricing is favorable.",
+    ProcurementDecision.WAIT.value: "⏸ Current stock levels are sufficient. Monitor for price improvements."
+}
+
+
 def generate_decision_reasoning(
     decision: str,
     stock_level: int,
@@ -198,27 +280,83 @@ def generate_decision_reasoning(
     
     reasoning_parts.append(f"Best supplier available: {best_supplier}")
     
-    if decision == ProcurementDecision.BUY_NOW.value:
-        reasoning_parts.append(f"✓ Low inventory with high demand requires immediate procurement.")
-    elif decision == ProcurementDecision.CONSIDER_BUYING.value:
-        reasoning_parts.append(f"⚠ Moderate inventory with high demand. Consider purchase if pricing is favorable.")
-    else:  # WAIT
-        reasoning_parts.append(f"⏸ Current stock levels are sufficient. Monitor for price improvements.")
+    reasoning_parts.append(_DECISION_MESSAGES.get(decision, _DECISION_MESSAGES[ProcurementDecision.WAIT.value]))
     
     return " | ".join(reasoning_parts)
 
 
+def generate_decision_reasonings_vec(
+    decisions,
+    stock_levels,
+    demand_levels,
+    supplier_prices,
+    average_prices,
+    best_suppliers
+) -> np.ndarray:
+    """
+    Generate reasoning text for many decisions at once.
+    
+    Produces the same text as generate_decision_reasoning, filling the
+    template with array-wide string operations instead of a call per row.
+    
+    Args:
+        decisions: Array-like of procurement decisions
+        stock_levels: Array-like of stock quantities
+        demand_levels: Array-like of demand levels
+        supplier_prices: Array-like of selected supplier prices
+        average_prices: Array-like of average market prices
+        best_suppliers: Array-like of best (cheapest) supplier names
+        
+    Returns:
+        Array of reasoning strings
+    """
+    stock = np.asarray(stock_levels)
+    supplier_prices = np.asarray(supplier_prices, dtype=np.float64)
+    average_prices = np.asarray(average_prices, dtype=np.float64)
+    decisions = np.asarray(decisions)
+    
+    price_savings = average_prices - supplier_prices
+    with np.errstate(divide="ignore", invalid="ignore"):
+        savings_pct = np.where(average_prices > 0, price_savings / average_prices * 100, 0.0)
+    savings_text = reduce(np.char.add, [" | (Savings: ", np.char.mod("%.1f", savings_pct), "% below average)"])
+    
+    messages = np.where(
+        decisions == ProcurementDecision.BUY_NOW.value,
+        _DECISION_MESSAGES[ProcurementDecision.BUY_NOW.value],
+        np.where(
+            decisions == ProcurementDecision.CONSIDER_BUYING.value,
+            _DECISION_MESSAGES[ProcurementDecision.CONSIDER_BUYING.value],
+            _DECISION_MESSAGES[ProcurementDecision.WAIT.value]
+        )
+    )
+    
+    return reduce(np.char.add, [
+        "Stock Level: ", get_stock_level_category_vec(stock),
+        " (", stock.astype(str), " units) | Demand: ", np.asarray(demand_levels).astype(str),
+        " | Supplier selected at $", np.char.mod("%.2f", supplier_prices),
+        " vs market average of $", np.char.mod("%.2f", average_prices),
+        np.where(price_savings > 0, savings_text, ""),
+        " | Best supplier available: ", np.asarray(best_suppliers).astype(str),
+        " | ", messages
+    ])
+
+
 def generate_recommendation(
     selected_supplier: str,
     selected_price: float,
     supplier_prices: Dict[str, float],
     stock_level: int,
-    demand_level: str
+    demand_level: str,
+    average_price: Optional[float] = None,
+    best_supplier: Optional[str] = None,
+    best_price: Optional[float] = None
 ) -> SupplierRecommendation:
     """
     Generate a complete procurement recommendation.
     
     This is the main entry point for the decision engine.
+    ItemDataProcessor.get_recommendation_inputs returns the precomputed
+    market metrics as a dictionary that can be passed straight through as keywords.
     
     Args:
         selected_supplier: Name of selected supplier
@@ -226,14 +364,76 @@ def generate_recommendation(
         supplier_prices: Dictionary of all supplier prices
         stock_level: Current stock quantity
         demand_level: Current demand level
+        average_price: Precomputed market average; computed from supplier_prices if omitted
+        best_supplier: Precomputed cheapest supplier; identified from supplier_prices
+            unless both best_supplier and best_price are given
+        best_price: Precomputed cheapest price
         
     Returns:
         SupplierRecommendation object with complete analysis
     """
     # Calculate metrics
-    average_price = calculate_average_price(list(supplier_prices.values()))
+    if average_price is None:
+        average_price = calculate_average_price(supplier_prices.values())
+    if best_supplier is None or best_price is None:
+        best_supplier, best_price = identify_best_supplier(supplier_prices)
+    
+    return _build_recommendation(
+        selected_price, average_price, best_supplier, best_price, stock_level, demand_level
+    )
+
+
+def generate_recommendation_from_arrays(
+    selected_supplier: str,
+    selected_price: float,
+    supplier_names: np.ndarray,
+    supplier_prices: np.ndarray,
+    stock_level: int,
+    demand_level: str
+) -> SupplierRecommendation:
+    """
+    Generate a complete procurement recommendation from parallel arrays.
+    
+    Same analysis as generate_recommendation, for callers that hold supplier
+    names and prices as arrays (e.g. ItemDataProcessor.get_supplier_price_arrays);
+    the average and cheapest supplier come from single vectorized reductions.
+    
+    Args:
+        selected_supplier: Name of selected supplier
+        selected_price: Price from selected supplier
+        supplier_names: Array of supplier names
+        supplier_prices: Array of supplier prices, aligned with supplier_names
+        stock_level: Current stock quantity
+        demand_level: Current demand level
+        
+    Returns:
+        SupplierRecommendation object with complete analysis
+    """
+    prices = np.asarray(supplier_prices, dtype=np.float64)
+    
+    if prices.size == 0:
+        average_price = 0.0
+        best_supplier, best_price = ("Unknown", 0.0)
+    else:
+        average_price = round(float(prices.mean()), 2)
+        best_idx = int(prices.argmin())
+        best_supplier, best_price = supplier_names[best_idx], float(prices[best_idx])
+    
+    return _build_recommendation(
+        selected_price, average_price, best_supplier, best_price, stock_level, demand_level
+    )
+
+
+def _build_recommendation(
+    selected_price: float,
+    average_price: float,
+    best_supplier: str,
+    best_price: float,
+    stock_level: int,
+    demand_level: str
+) -> SupplierRecommendation:
+    """Assemble the decision, reasoning and recommendation from computed metrics"""
     negotiation_price = calculate_negotiation_price(average_price)
-    best_supplier, best_price = identify_best_supplier(supplier_prices)
     stock_category = get_stock_level_category(stock_level)
     
     # Make decision
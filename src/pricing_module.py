@@ -12,6 +12,70 @@ import pandas as pd
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+PRODUCT_ANALYSIS_COLUMNS = ["product_name", "supplier_name", "brand", "selling_price", "mrp", "pack_size"]
+PRICE_STATISTICS_COLUMNS = ["product_name", "selling_price", "mrp", "supplier_name", "brand"]
+
+
+def _sorted_percentile(sorted_values: np.ndarray, q: float) -> float:
+    """Linearly interpolated percentile (as np.percentile) of an already sorted array"""
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return float(sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo))
+
+
+def _sorted_median(sorted_values: np.ndarray) -> float:
+    """Median of an already sorted array"""
+    n = len(sorted_values)
+    return float((sorted_values[(n - 1) // 2] + sorted_values[n // 2]) / 2)
+
+
+def _grouped_price_stats(keys: np.ndarray, prices: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Per-key count, mean, sample std, min and max over sorted runs (keys in first-seen order)"""
+    valid = ~(pd.isna(keys) | np.isnan(prices))
+    keys, prices = keys[valid], prices[valid]
+    
+    order = np.argsort(keys, kind="stable")
+    sorted_prices = prices[order]
+    uniq, starts = np.unique(keys[order], return_index=True)
+    counts = np.diff(np.append(starts, len(sorted_prices)))
+    
+    mean = np.add.reduceat(sorted_prices, starts) / counts
+    deviations = sorted_prices - np.repeat(mean, counts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(np.add.reduceat(deviations * deviations, starts) / (counts - 1))
+    min_price = np.minimum.reduceat(sorted_prices, starts)
+    max_price = np.maximum.reduceat(sorted_prices, starts)
+    
+    # order[starts] is each key's first row, so this restores appearance order
+    first_seen = np.argsort(order[starts], kind="stable")
+    return tuple(arr[first_seen] for arr in (uniq, counts, mean, std, min_price, max_price))
+
+
+def calculate_discount_pct(df: pd.DataFrame) -> np.ndarray:
+    """
+    Calculate the per-row discount % off MRP.
+    
+    Rows whose MRP is not positive get a 0% discount rather than inf/NaN.
+    
+    Args:
+        df: Product dataframe with mrp and selling_price columns
+        
+    Returns:
+        float64 array of discount percentages, one per row
+    """
+    mrp = df["mrp"].to_numpy(np.float64)
+    selling_price = df["selling_price"].to_numpy(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(mrp > 0, (mrp - selling_price) / mrp * 100.0, 0.0)
+
+
+def _discount_pct(df: pd.DataFrame) -> pd.Series:
+    """Per-row discount %, reusing the discount_pct column precomputed at load when present"""
+    if "discount_pct" in df.columns:
+        return df["discount_pct"]
+    return pd.Series(calculate_discount_pct(df), index=df.index)
+
 
 class PricingAnalyzer:
     """
@@ -19,10 +83,57 @@ class PricingAnalyzer:
     Analyzes price variations, calculates fair pricing, and generates insights.
     """
 
-    def __init__(self):
-        """Initialize pricing analyzer"""
+    def __init__(self, df: Optional[pd.DataFrame] = None):
+        """
+        Initialize pricing analyzer.
+        
+        Args:
+            df: Optional product dataframe to index by product_id up front, so
+                per-product lookups on that data skip the full-column scan
+        """
         self.discount_margin = 0.05  # 5% negotiation margin
         self.price_variance_threshold = 0.20  # 20% variance is significant
+        
+        # product_id -> row positions of the indexed data (the frame itself is not kept)
+        self._product_index: Optional[Dict] = None
+        self._indexed_rows = 0
+        if df is not None:
+            self.index_products(df)
+
+    def index_products(self, df: pd.DataFrame) -> None:
+        """
+        Build the product_id -> row positions index for a dataframe.
+        
+        Later calls must pass the same data (e.g. an unmodified copy, as
+        st.cache_data hands out); other frames fall back to a column scan.
+        
+        Args:
+            df: Product dataframe
+        """
+        self._product_index = df.groupby("product_id", sort=False).indices
+        self._indexed_rows = len(df)
+
+    def _product_positions(self, df: pd.DataFrame, product_id: int) -> np.ndarray:
+        """Row positions of one product in df, from the index when df matches the indexed data"""
+        product_ids = df["product_id"].to_numpy()
+        if self._product_index is not None and len(df) == self._indexed_rows:
+            rows = self._product_index.get(product_id, np.empty(0, dtype=np.intp))
+            # Cheap guard against a different frame that happens to have the same length
+            if (product_ids[rows] == product_id).all():
+                return rows
+        return np.flatnonzero(product_ids == product_id)
+
+    def _product_rows(self, df: pd.DataFrame, product_id: int, columns: List[str] = None) -> pd.DataFrame:
+        """Rows of df (optionally only some columns) for one product"""
+        rows = self._product_positions(df, product_id)
+        if columns is None:
+            return df.iloc[rows]
+        
+        col_positions = df.columns.get_indexer(columns)
+        if (col_positions < 0).any():
+            missing = [col for col, pos in zip(columns, col_positions) if pos < 0]
+            raise KeyError(f"Columns not found: {missing}")
+        return df.iloc[rows, col_positions]
 
     def analyze_product_pricing(self, df: pd.DataFrame, product_id: int) -> Dict:
         """
@@ -35,17 +146,19 @@ class PricingAnalyzer:
         Returns:
             Dictionary with detailed pricing insights
         """
-        product_data = df[df["product_id"] == product_id].copy()
+        # Only the columns read below are gathered for the product's rows
+        columns = PRODUCT_ANALYSIS_COLUMNS + (["discount_pct"] if "discount_pct" in df.columns else [])
+        product_data = self._product_rows(df, product_id, columns)
         
         if product_data.empty:
             return {"error": "Product not found"}
         
-        prices = product_data["selling_price"].values
-        mrp_prices = product_data["mrp"].values
-        discount_pct = ((mrp_prices - prices) / mrp_prices * 100).mean()
+        prices = product_data["selling_price"].to_numpy()
+        mrp_prices = product_data["mrp"].to_numpy()
+        discount_pct = _discount_pct(product_data).mean()
         
         analysis = {
-            "product_name": product_data.iloc[0]["product_name"],
+            "product_name": product_data["product_name"].iat[0],
             "product_id": product_id,
             "avg_mrp": float(mrp_prices.mean()),
             "avg_selling_price": float(prices.mean()),
@@ -60,24 +173,31 @@ class PricingAnalyzer:
         }
         
         # Price comparison by supplier
-        supplier_prices = product_data[["supplier_name", "brand", "selling_price", "mrp", "pack_size"]].copy()
+        supplier_prices = product_data[["supplier_name", "brand", "selling_price", "mrp", "pack_size"]]
         analysis["supplier_comparison"] = supplier_prices.to_dict("records")
         
         return analysis
 
     def _calculate_fair_price(self, prices: np.ndarray) -> float:
         """Calculate fair market price using median with outlier removal"""
+        # One sort serves the quartiles, the IQR filter and the median
+        sorted_prices = np.sort(np.asarray(prices, dtype=float))
+        if np.isnan(sorted_prices[-1]):
+            return float("nan")
+        
         # Remove outliers using IQR method
-        Q1 = np.percentile(prices, 25)
-        Q3 = np.percentile(prices, 75)
+        Q1 = _sorted_percentile(sorted_prices, 0.25)
+        Q3 = _sorted_percentile(sorted_prices, 0.75)
         IQR = Q3 - Q1
         
-        filtered_prices = prices[(prices >= Q1 - 1.5*IQR) & (prices <= Q3 + 1.5*IQR)]
+        lo = np.searchsorted(sorted_prices, Q1 - 1.5*IQR, side="left")
+        hi = np.searchsorted(sorted_prices, Q3 + 1.5*IQR, side="right")
+        filtered_prices = sorted_prices[lo:hi]
         
         if len(filtered_prices) == 0:
-            return float(np.median(prices))
+            return _sorted_median(sorted_prices)
         
-        return float(np.median(filtered_prices))
+        return _sorted_median(filtered_prices)
 
     def calculate_procurement_price(self, fair_price: float, negotiation_margin: float = None) -> float:
         """
@@ -104,21 +224,33 @@ class PricingAnalyzer:
         Returns:
             DataFrame with price statistics
         """
+        # Project to the aggregated columns before filtering so the mask copies only those
+        data = df[PRICE_STATISTICS_COLUMNS]
         if category:
-            data = df[df["category"] == category]
-        else:
-            data = df
-        
-        stats = data.groupby("product_name").agg({
-            "selling_price": ["mean", "min", "max", "std"],
-            "mrp": "mean",
-            "supplier_name": "count",
-            "brand": lambda x: x.mode()[0] if len(x.mode()) > 0 else x.iloc[0]
-        }).round(2)
-        
-        stats.columns = ["Avg Price", "Min Price", "Max Price", "Std Dev", "Avg MRP", "Suppliers", "Brand"]
+            data = data[df["category"] == category]
+        
+        stats = data.groupby("product_name", observed=True).agg(
+            **{
+                "Avg Price": ("selling_price", "mean"),
+                "Min Price": ("selling_price", "min"),
+                "Max Price": ("selling_price", "max"),
+                "Std Dev": ("selling_price", "std"),
+                "Avg MRP": ("mrp", "mean"),
+                "Suppliers": ("supplier_name", "count"),
+            }
+        ).round(2)
+        stats["Brand"] = self._most_common_brand(data).reindex(stats.index).to_numpy()
         return stats.sort_values("Avg Price", ascending=False)
 
+    @staticmethod
+    def _most_common_brand(data: pd.DataFrame) -> pd.Series:
+        """Most frequent brand per product, ties broken by brand order (like Series.mode)"""
+        counts = data.groupby(["product_name", "brand"], observed=True).size()
+        counts = counts.sort_values(ascending=False, kind="stable")
+        products = counts.index.get_level_values(0)
+        top = counts.index[~products.duplicated()]
+        return pd.Series(top.get_level_values(1), index=top.get_level_values(0))
+
     def identify_price_anomalies(self, df: pd.DataFrame, product_id: int = None) -> pd.DataFrame:
         """
         Identify products with unusual price variations across suppliers.
@@ -131,29 +263,30 @@ class PricingAnalyzer:
             DataFrame with anomalies
         """
         if product_id:
-            data = df[df["product_id"] == product_id]
+            data = self._product_rows(df, product_id)
         else:
             data = df
         
-        anomalies = []
-        
-        for product in data["product_id"].unique():
-            product_prices = data[data["product_id"] == product]["selling_price"]
-            
-            if len(product_prices) > 1:
-                cv = product_prices.std() / product_prices.mean()  # Coefficient of variation
-                
-                if cv > self.price_variance_threshold:
-                    anomalies.append({
-                        "product_id": product,
-                        "product_name": data[data["product_id"] == product].iloc[0]["product_name"],
-                        "max_price": product_prices.max(),
-                        "min_price": product_prices.min(),
-                        "variance_pct": (cv * 100),
-                        "status": "High Variance"
-                    })
-        
-        return pd.DataFrame(anomalies)
+        pids, counts, mean, std, min_price, max_price = _grouped_price_stats(
+            data["product_id"].to_numpy(), data["selling_price"].to_numpy(dtype=float)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cv = std / mean  # Coefficient of variation
+        flagged = (counts > 1) & (cv > self.price_variance_threshold)
+        
+        # First product_name per product_id, taken from the two columns only
+        names = pd.Series(data["product_name"].to_numpy(), index=data["product_id"].to_numpy())
+        names = names[~names.index.duplicated()]
+        
+        flagged_pids = pids[flagged]
+        return pd.DataFrame({
+            "product_id": flagged_pids,
+            "product_name": names.reindex(flagged_pids).to_numpy(),
+            "max_price": max_price[flagged],
+            "min_price": min_price[flagged],
+            "variance_pct": cv[flagged] * 100,
+            "status": np.full(len(flagged_pids), "High Variance", dtype=object),
+        })
 
     def compare_suppliers(self, df: pd.DataFrame, product_id: int = None, category: str = None) -> pd.DataFrame:
         """
@@ -168,19 +301,21 @@ class PricingAnalyzer:
             DataFrame with supplier comparison
         """
         if product_id:
-            data = df[df["product_id"] == product_id]
+            data = self._product_rows(df, product_id)
         elif category:
             data = df[df["category"] == category]
         else:
             data = df
         
-        supplier_comparison = data.groupby("supplier_name").agg({
-            "selling_price": ["mean", "min", "max"],
-            "product_id": "count",
-            "brand": "nunique"
-        }).round(2)
-        
-        supplier_comparison.columns = ["Avg Price", "Min Price", "Max Price", "Products Offered", "Brands"]
+        supplier_comparison = data.groupby("supplier_name", observed=True).agg(
+            **{
+                "Avg Price": ("selling_price", "mean"),
+                "Min Price": ("selling_price", "min"),
+                "Max Price": ("selling_price", "max"),
+                "Products Offered": ("product_id", "count"),
+                "Brands": ("brand", "nunique"),
+            }
+        ).round(2)
         supplier_comparison = supplier_comparison.sort_values("Avg Price")
         
         return supplier_comparison
@@ -195,10 +330,9 @@ class PricingAnalyzer:
         Returns:
             DataFrame with discount statistics
         """
-        df_copy = df.copy()
-        df_copy["discount_pct"] = ((df_copy["mrp"] - df_copy["selling_price"]) / df_copy["mrp"] * 100).round(2)
+        discount_pct = _discount_pct(df).round(2)
         
-        discount_stats = df_copy.groupby("category")["discount_pct"].agg([
+        discount_stats = discount_pct.groupby(df["category"], observed=True).agg([
             "mean", "min", "max", "std"
         ]).round(2)
         
@@ -217,22 +351,24 @@ class PricingAnalyzer:
         Returns:
             Dictionary with savings analysis
         """
-        product_data = df[df["product_id"] == product_id]
+        product_data = self._product_rows(df, product_id)
         
         if product_data.empty:
             return {"error": "Product not found"}
         
-        prices = product_data["selling_price"]
-        max_price = prices.max()
-        min_price = prices.min()
+        prices = product_data["selling_price"].to_numpy()
+        i_max = np.nanargmax(prices)
+        i_min = np.nanargmin(prices)
+        max_price = prices[i_max]
+        min_price = prices[i_min]
         savings_per_unit = max_price - min_price
         savings_pct = (savings_per_unit / max_price) * 100
         
-        worst_supplier = product_data[product_data["selling_price"] == max_price]["supplier_name"].values[0]
-        best_supplier = product_data[product_data["selling_price"] == min_price]["supplier_name"].values[0]
+        worst_supplier = product_data["supplier_name"].iat[i_max]
+        best_supplier = product_data["supplier_name"].iat[i_min]
         
         return {
-            "product_name": product_data.iloc[0]["product_name"],
+            "product_name": product_data["product_name"].iat[0],
             "savings_per_unit": round(savings_per_unit, 2),
             "savings_percentage": round(savings_pct, 2),
             "current_supplier": worst_supplier,
@@ -251,7 +387,7 @@ class PricingAnalyzer:
         Returns:
             Dictionary with supplier insights
         """
-        supplier_stats = df.groupby("supplier_name")["selling_price"].agg([
+        supplier_stats = df.groupby("supplier_name", observed=True)["selling_price"].agg([
             "mean", "min", "max", "std"
         ]).round(2)
         
@@ -5,6 +5,9 @@ This module provides helper functions for formatting, charting, and other
 common operations used throughout the application.
 """
 
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from typing import Dict, List
 import streamlit as st
@@ -23,6 +26,20 @@ def format_currency(value: float) -> str:
     return f"${value:,.2f}"
 
 
+def format_currency_vec(values: np.ndarray) -> np.ndarray:
+    """
+    Format an array of values as USD currency (vectorized format_currency).
+    
+    Args:
+        values: Numeric values to format
+        
+    Returns:
+        Array of formatted currency strings
+    """
+    values = np.asarray(values, dtype=float).tolist()
+    return np.array(list(map("${:,.2f}".format, values)), dtype=object)
+
+
 def format_percentage(value: float, decimals: int = 1) -> str:
     """
     Format a value as percentage.
@@ -91,90 +108,115 @@ def get_stock_color(stock_level: int) -> str:
         return '🟢'  # High
 
 
-def create_price_comparison_chart(supplier_prices: Dict[str, float]):
-    """
-    Create a bar chart comparing supplier prices.
-    
-    Args:
-        supplier_prices: Dictionary mapping supplier names to prices
-    """
-    if not supplier_prices:
-        st.warning("No supplier data available for chart.")
-        return
-    
-    # Create chart data
-    suppliers = list(supplier_prices.keys())
-    prices = list(supplier_prices.values())
-    
-    # Sort by price for better visualization
-    sorted_data = sorted(zip(suppliers, prices), key=lambda x: x[1])
-    suppliers_sorted = [x[0] for x in sorted_data]
-    prices_sorted = [x[1] for x in sorted_data]
+@lru_cache(maxsize=None)
+def _price_chart_template():
+    """Active Plotly template extended with the layout shared by the supplier price charts"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
     
+    template = go.layout.Template(pio.templates[pio.templates.default])
+    template.layout.update(yaxis_title="Unit Price ($)", showlegend=False)
+    return template
+
+
+@st.cache_data
+def _build_comparison_fig(suppliers: tuple, prices: tuple):
+    """Build and cache the supplier price bar chart from price-sorted inputs"""
     import plotly.graph_objects as go
     
     # Create bar chart
     fig = go.Figure(data=[
         go.Bar(
-            x=suppliers_sorted,
-            y=prices_sorted,
-            marker_color=['#1f77b4' if i == 0 else '#ff7f0e' for i in range(len(prices_sorted))],
-            text=[f"${p:.2f}" for p in prices_sorted],
+            x=suppliers,
+            y=prices,
+            marker_color=['#1f77b4' if i == 0 else '#ff7f0e' for i in range(len(prices))],
+            text=format_currency_vec(prices),
             textposition='auto',
             hovertemplate='<b>%{x}</b><br>Price: $%{y:.2f}<extra></extra>'
         )
-    ])
-    
-    fig.update_layout(
+    ], layout=go.Layout(
+        template=_price_chart_template(),
         title="Supplier Price Comparison",
         xaxis_title="Supplier",
-        yaxis_title="Unit Price ($)",
         height=400,
-        showlegend=False,
         hovermode='x unified'
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    ))
+    return fig
 
 
-def create_price_distribution_chart(supplier_data: pd.DataFrame):
+def create_price_comparison_chart(supplier_prices: Dict[str, float]):
     """
-    Create a distribution chart showing min, average, and max prices.
+    Create a bar chart comparing supplier prices.
     
     Args:
-        supplier_data: DataFrame with supplier price data
+        supplier_prices: Dictionary mapping supplier names to prices
     """
-    if supplier_data.empty:
-        st.warning("No data available for distribution chart.")
+    if not supplier_prices:
+        st.warning("No supplier data available for chart.")
         return
     
+    # Sort by price for better visualization
+    suppliers = np.asarray(list(supplier_prices.keys()), dtype=object)
+    prices = np.fromiter(supplier_prices.values(), dtype=np.float64, count=len(supplier_prices))
+    order = np.argsort(prices, kind="stable")
+    suppliers_sorted = tuple(suppliers[order].tolist())
+    prices_sorted = tuple(prices[order].tolist())
+    
+    st.plotly_chart(_build_comparison_fig(suppliers_sorted, prices_sorted), use_container_width=True)
+
+
+@st.cache_data
+def _build_distribution_fig(prices: np.ndarray):
+    """Build and cache the price distribution box plot"""
     import plotly.graph_objects as go
     
-    prices = supplier_data['unit_price'].values
-    min_price = prices.min()
-    max_price = prices.max()
-    avg_price = prices.mean()
+    # Box drawn from precomputed statistics so only the outliers ship to the browser
+    q1, median, q3 = np.percentile(prices, [25, 50, 75])
+    iqr = q3 - q1
+    is_outlier = (prices < q1 - 1.5 * iqr) | (prices > q3 + 1.5 * iqr)
+    inliers = prices[~is_outlier]
     
-    # Create box plot
     fig = go.Figure(data=[
         go.Box(
-            y=prices,
+            q1=[q1],
+            median=[median],
+            q3=[q3],
+            lowerfence=[inliers.min()],
+            upperfence=[inliers.max()],
+            mean=[prices.mean()],
+            sd=[prices.std()],
+            y=[prices[is_outlier].astype(np.float32)],
+            boxpoints='outliers',
             name='Prices',
             marker_color='#1f77b4',
-            boxmean='sd',
             hovertemplate='Price: $%{y:.2f}<extra></extra>'
         )
-    ])
-    
-    fig.update_layout(
+    ], layout=go.Layout(
+        template=_price_chart_template(),
         title="Price Distribution Across Suppliers",
-        yaxis_title="Unit Price ($)",
         height=300,
-        showlegend=False,
         hovermode='closest'
-    )
+    ))
+    return fig
+
+
+def create_price_distribution_chart(supplier_data: pd.DataFrame):
+    """
+    Create a distribution chart showing min, average, and max prices.
+    
+    Args:
+        supplier_data: DataFrame with supplier price data
+    """
+    if supplier_data.empty:
+        st.warning("No data available for distribution chart.")
+        return
+    
+    prices = supplier_data['unit_price'].to_numpy(dtype=float)
+    min_price = prices.min()
+    max_price = prices.max()
+    avg_price = prices.mean()
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_build_distribution_fig(prices), use_container_width=True)
     
     # Display statistics
     col1, col2, col3, col4 = st.columns(4)
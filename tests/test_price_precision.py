@@ -0,0 +1,70 @@
+"""
+Price precision checks: loaded prices must round to the same 2-dp values
+as the CSV, not to float32 approximations of them.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.catalog_module import ProductCatalog
+from src.data_loader_ecommerce import IndianEcommerceCatalogLoader
+from src.pricing_module import PricingAnalyzer
+
+CSV_ROWS = [
+    "product_id,product_name,category,subcategory,brand,supplier_name,mrp,selling_price,pack_size,unit",
+    "1,Aeroplane Basmati Rice,Rice & Grains,Basmati,Aeroplane,BigBasket,150.00,124.91,1,kg",
+    "1,Aeroplane Basmati Rice,Rice & Grains,Basmati,Aeroplane,Blinkit,150.00,137.30,1,kg",
+    "1,Aeroplane Basmati Rice,Rice & Grains,Basmati,Aeroplane,Grofers,150.00,119.99,1,kg",
+    "2,Amul Taaza Milk,Milk & Dairy,Milk,Amul,BigBasket,68.50,64.35,1,litre",
+    "2,Amul Taaza Milk,Milk & Dairy,Milk,Amul,Blinkit,68.50,66.15,1,litre",
+]
+
+
+class PricePrecisionTest(unittest.TestCase):
+    """Summary and savings values match their 2-dp baseline"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        csv_path = os.path.join(cls.tmp_dir, "catalog.csv")
+        with open(csv_path, "w") as f:
+            f.write("\n".join(CSV_ROWS) + "\n")
+        cls.df = IndianEcommerceCatalogLoader(csv_path).get_dataframe()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def assertPrice(self, value, expected):
+        """Compare as Python floats: numpy would cast 137.3 down to match a float32 value"""
+        self.assertEqual(float(value), expected)
+
+    def test_catalog_summary_avg_price(self):
+        summary = ProductCatalog(self.df).get_catalog_summary()
+        self.assertPrice(summary["avg_product_price"], 102.54)
+        self.assertEqual(summary["price_range"], "64.35 - 137.30")
+
+    def test_savings_opportunity(self):
+        savings = PricingAnalyzer().calculate_savings_opportunity(self.df, 1)
+        self.assertPrice(savings["savings_per_unit"], 17.31)
+        self.assertPrice(savings["savings_percentage"], 12.61)
+        self.assertPrice(savings["current_price"], 137.3)
+        self.assertPrice(savings["best_price"], 119.99)
+        self.assertEqual(savings["best_supplier"], "Grofers")
+
+    def test_savings_opportunity_small_prices(self):
+        savings = PricingAnalyzer().calculate_savings_opportunity(self.df, 2)
+        self.assertPrice(savings["savings_per_unit"], 1.8)
+        self.assertPrice(savings["current_price"], 66.15)
+        self.assertPrice(savings["best_price"], 64.35)
+
+    def test_compare_suppliers(self):
+        comparison = PricingAnalyzer().compare_suppliers(self.df, product_id=1)
+        self.assertPrice(comparison.loc["BigBasket", "Avg Price"], 124.91)
+        self.assertPrice(comparison.loc["Grofers", "Min Price"], 119.99)
+
+
+if __name__ == "__main__":
+    unittest.main()